@@ -1,20 +1,28 @@
 import tkinter as tk
 from tkinter import Canvas, Button
-from PIL import Image, ImageTk, ImageWin
 import os
-import glob
 import time
 import threading
 import subprocess
-import win32print
-import win32ui
 import random
 import shutil
-from typing import Optional
+import shlex
+from typing import Optional, Union
 import json
+import re
 import ctypes
 import sys
+import queue
+import atexit
+import uuid
+import hashlib
+import locale
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+import concurrent.futures
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 
 # ============================================================================
 # CONFIGURATION
@@ -24,9 +32,22 @@ from abc import ABC, abstractmethod
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PHOTO_DIR = os.path.join(SCRIPT_DIR, 'Photos')
 TEMP_DIR = os.path.join(SCRIPT_DIR, 'Temp')
+# gphoto2 downloads land here, on PHOTO_DIR's filesystem, so publishing a shot is a rename
+CAPTURE_DIR = os.path.join(PHOTO_DIR, '.incoming')
+LEGACY_CAPTURE_DIR = os.path.join(TEMP_DIR, 'captures')  # pre-.incoming staging, swept until empty
+TEMP_MAX_AGE_DAYS = 1  # staged downloads older than this are removed at startup
 DRIVE_DIR = r"G:\My Drive\New_Year_Photo_Booth"  # Google Drive location
 LOG_PATH = os.path.join(TEMP_DIR, "booth.log")
-LOGO_CANDIDATES = [
+THUMB_DIR = os.path.join(TEMP_DIR, "cache", "thumbs")  # Gallery display caches, see PhotoZoomViewer
+
+
+def _candidate_paths(*paths: str) -> tuple:
+    """Absolute, de-duplicated candidate paths in priority order (empty entries dropped)."""
+    # normcase folds logo.png/logo.PNG together on Windows' case-insensitive FS
+    return tuple(dict.fromkeys(os.path.normcase(os.path.abspath(p)) for p in paths if p))
+
+
+LOGO_CANDIDATES = _candidate_paths(
     os.environ.get("LOGO_PATH", ""),
     os.path.join(SCRIPT_DIR, "logo.png"),
     os.path.join(SCRIPT_DIR, "logo.PNG"),
@@ -34,10 +55,10 @@ LOGO_CANDIDATES = [
     os.path.join(SCRIPT_DIR, "logo.jpeg"),
     "logo.png",
     "logo.PNG",
-]
+)
 
 # Promo logo for right side
-PROMO_LOGO_CANDIDATES = [
+PROMO_LOGO_CANDIDATES = _candidate_paths(
     os.environ.get("PROMO_LOGO_PATH", ""),
     os.path.join(SCRIPT_DIR, "promo.png"),
     os.path.join(SCRIPT_DIR, "promo.PNG"),
@@ -47,15 +68,13 @@ PROMO_LOGO_CANDIDATES = [
     os.path.join(SCRIPT_DIR, "sponsor.jpg"),
     "promo.png",
     "promo.PNG",
-]
+)
 
-# Create all required directories
-os.makedirs(PHOTO_DIR, exist_ok=True)
-os.makedirs(TEMP_DIR, exist_ok=True)
-os.makedirs(os.path.join(TEMP_DIR, "captures"), exist_ok=True)
-os.makedirs(os.path.join(TEMP_DIR, "cache"), exist_ok=True)
+# Create all required directories (stat first: mkdir on the Drive mount can block)
+for _d in (PHOTO_DIR, TEMP_DIR, CAPTURE_DIR, os.path.join(TEMP_DIR, "cache"), THUMB_DIR):
+    os.path.isdir(_d) or os.makedirs(_d, exist_ok=True)
 try:
-    os.makedirs(DRIVE_DIR, exist_ok=True)
+    os.path.isdir(DRIVE_DIR) or os.makedirs(DRIVE_DIR, exist_ok=True)
 except Exception:
     DRIVE_DIR = os.path.join(SCRIPT_DIR, 'Saved')
     os.makedirs(DRIVE_DIR, exist_ok=True)
@@ -63,11 +82,15 @@ except Exception:
 # WSL / gphoto2 settings
 WSL_DISTRO = "Ubuntu-22.04"
 GPHOTO_CMD = "gphoto2"
+DEBUG_CAPTURE = False  # True = log every gphoto2 output line and path detail during capture
 
 # USB camera settings - Nikon Z6_3
 CAMERA_VID_PID = "04b0:0454"
 CAMERA_DEVICE_NAME = "Z6_3"
 USBIPD_EXE = r"C:\Program Files\usbipd-win\usbipd.exe"
+_USBIPD_PRESENT = os.path.exists(USBIPD_EXE)  # resolved once; polled helpers skip the stat
+WSL_START_TIMEOUT = 30  # seconds allowed for the persistent WSL shell to come up cold
+SETUP_FRESH_SECONDS = 120  # a full setup this recent is reused by the pre-capture reconnect
 
 # Theme Colors - Premium New Year 2026
 THEME_BG = "#0d0d1a"
@@ -100,13 +123,137 @@ PRINT_MARGIN_INCHES = 0.0          # Margin around the image in inches
 PRINT_FIT_TO_PAGE = True           # True = fit image to page, False = use original size
 PRINT_CENTER_ON_PAGE = True        # Center the image on the page
 
+# Suppress console windows for child processes (powercfg, usbipd, wsl, powershell)
+NO_WINDOW = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+
 # Global print job counter
 _print_job_counter = 0
+# printer name -> (printable width, printable height, dpi x, dpi y); cleared by F5
+_PRINTER_CAPS: dict = {}
 
 # ============================================================================
 # HELPERS
 # ============================================================================
 
+# PIL is imported on first UI use (see _load_pil) so the camera setup thread started
+# in main() overlaps the import instead of waiting behind it.
+Image = ImageTk = None
+
+
+def _load_pil():
+    """Import PIL.Image/ImageTk into module globals on first use."""
+    global Image, ImageTk
+    if Image is None:
+        import PIL
+        from PIL import Image, ImageTk
+        # Pillow-SIMD versions carry a .postN suffix
+        write_log(f"PIL {PIL.__version__}{' (SIMD)' if '.post' in PIL.__version__ else ''}")
+
+
+_cv2 = None  # OpenCV module, False if unavailable; see _load_cv2
+
+
+def _load_cv2():
+    """Optional OpenCV (opencv-python) for faster interactive resizes; False if not installed."""
+    global _cv2
+    if _cv2 is None:
+        try:
+            import cv2
+            import numpy  # noqa: F401 - cv2 needs it; fail here rather than mid-render
+            _cv2 = cv2
+            write_log(f"OpenCV {cv2.__version__} available for gallery resizes")
+        except Exception:
+            _cv2 = False
+    return _cv2
+
+
+@lru_cache(maxsize=32)
+def _pil_font(size: int, *names: str):
+    """First of the named TrueType fonts that loads, at size pixels (PIL's own font if none)."""
+    from PIL import ImageFont
+    for name in names:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)  # Scalable since Pillow 10.1
+    except TypeError:
+        return ImageFont.load_default()
+
+
+# Windows font files for FONT_FAMILY bold, then portable fallbacks
+BOLD_FONT_FILES = ("segoeuib.ttf", "arialbd.ttf", "DejaVuSans-Bold.ttf")
+
+
+def _file_size(path: str) -> int:
+    """Size of path in bytes, or 0 if it doesn't exist (one stat instead of exists + getsize)."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def _staging_path(save_path: str) -> str:
+    """Where a capture for save_path is downloaded before it is validated."""
+    return os.path.join(CAPTURE_DIR, os.path.basename(save_path))
+
+
+def _publish_capture(staged: str, save_path: str, min_size: int) -> int:
+    """Move a staged download to save_path if it is at least min_size bytes.
+    Returns its size, or 0 after removing a short/partial file."""
+    size = _file_size(staged)
+    if size < min_size:
+        try:
+            os.remove(staged)
+        except OSError:
+            pass
+        return 0
+    if os.path.normcase(staged) != os.path.normcase(save_path):
+        # A rename when save_path is on CAPTURE_DIR's filesystem (PHOTO_DIR is)
+        shutil.move(staged, save_path)
+    return size
+
+
+# Destination folders where os.link failed (another volume, or the Drive client's
+# virtual drive): go straight to copying there next time
+_NO_HARDLINK_DIRS: set = set()
+
+
+def fast_copy(src: str, dst: str) -> None:
+    """Hard-link src to dst when both are on one NTFS volume (O(1), no bytes copied);
+    otherwise copy2. The photo is never modified, so sharing its data is safe."""
+    dst_dir = os.path.dirname(dst)
+    if dst_dir not in _NO_HARDLINK_DIRS:
+        try:
+            os.link(src, dst)
+            return
+        except FileExistsError:
+            if os.path.samefile(src, dst):
+                return  # Already linked by an earlier upload
+            # Otherwise replace it like copy2 would
+        except OSError:
+            _NO_HARDLINK_DIRS.add(dst_dir)
+    shutil.copy2(src, dst)
+
+
+def run_in_background(fn, *args) -> Future:
+    """Run fn(*args) on a daemon thread and return a Future for its result."""
+    future: Future = Future()
+
+    def runner():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=runner, daemon=True).start()
+    return future
+
+
+@lru_cache(maxsize=256)
 def windows_path_to_wsl(path: str) -> str:
     """Convert Windows path to WSL path."""
     drive, rest = os.path.splitdrive(path)
@@ -115,19 +262,58 @@ def windows_path_to_wsl(path: str) -> str:
     return f"/mnt/{drive_letter}/{rest}"
 
 
+# Log lines are handed to a background writer so callers never block on file I/O
+_log_queue: "queue.Queue[Optional[str]]" = queue.Queue()
+
+
+def _log_writer():
+    """Drain the log queue into LOG_PATH through one long-lived file handle."""
+    try:
+        fh = open(LOG_PATH, "a", buffering=1 << 16, encoding="utf-8")
+    except Exception:
+        fh = None
+    written = 0
+    while True:
+        line = _log_queue.get()
+        try:
+            if line is None:
+                if fh:
+                    fh.close()
+                return
+            if fh:
+                fh.write(line + "\n")
+                written += 1
+                # Flush when caught up, or every 16 lines during bursts
+                if _log_queue.empty() or written % 16 == 0:
+                    fh.flush()
+        except Exception:
+            pass
+        finally:
+            _log_queue.task_done()
+
+
+_log_thread = threading.Thread(target=_log_writer, name="log-writer", daemon=True)
+_log_thread.start()
+
+
+def _shutdown_log_writer():
+    """Flush pending log lines and close the log file at interpreter exit."""
+    _log_queue.put(None)
+    _log_thread.join(timeout=2)
+
+
+atexit.register(_shutdown_log_writer)
+
+
 def write_log(msg: str):
-    """Log to console and file."""
+    """Log to console and (asynchronously) to file."""
     ts = time.strftime("%Y-%m-%d %H:%M:%S")
     line = f"{ts} {msg}"
     try:
         print(line, flush=True)
     except Exception:
         pass
-    try:
-        with open(LOG_PATH, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
-    except Exception:
-        pass
+    _log_queue.put(line)
 
 
 def is_admin() -> bool:
@@ -158,16 +344,18 @@ def ensure_elevated():
         sys.exit(1)
 
 
+@lru_cache(maxsize=1)
 def resolve_logo_path() -> Optional[str]:
-    """Find first existing logo file."""
+    """Find first existing logo file (cached for the process lifetime)."""
     for path in LOGO_CANDIDATES:
         if path and os.path.exists(path):
             return path
     return None
 
 
+@lru_cache(maxsize=1)
 def resolve_promo_logo_path() -> Optional[str]:
-    """Find first existing promotional logo file."""
+    """Find first existing promotional logo file (cached for the process lifetime)."""
     for path in PROMO_LOGO_CANDIDATES:
         if path and os.path.exists(path):
             return path
@@ -175,42 +363,87 @@ def resolve_promo_logo_path() -> Optional[str]:
 
 
 def cleanup_old_temp_files(max_age_days: int = 0):
-    """Clean up temporary files older than max_age_days."""
+    """Clean up staged capture files older than max_age_days."""
     try:
         cutoff_time = time.time() - (max_age_days * 86400)
-        temp_captures = os.path.join(TEMP_DIR, "captures")
-        
-        if os.path.exists(temp_captures):
-            for filename in os.listdir(temp_captures):
-                filepath = os.path.join(temp_captures, filename)
-                try:
-                    if os.path.isfile(filepath) and os.path.getmtime(filepath) < cutoff_time:
-                        os.remove(filepath)
-                        write_log(f"Deleted old temp file: {filename}")
-                except Exception as e:
-                    write_log(f"Could not delete {filename}: {e}")
+        for folder in (CAPTURE_DIR, LEGACY_CAPTURE_DIR):
+            if not os.path.exists(folder):
+                continue
+            # scandir entries carry file type/stat info, avoiding a stat per check
+            with os.scandir(folder) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < cutoff_time:
+                            os.remove(entry.path)
+                            write_log(f"Deleted old temp file: {entry.name}")
+                    except Exception as e:
+                        write_log(f"Could not delete {entry.name}: {e}")
+        try:
+            os.rmdir(LEGACY_CAPTURE_DIR)  # Only succeeds once the old folder is empty
+        except OSError:
+            pass
     except Exception as e:
         write_log(f"Cleanup error: {e}")
 
 
+# Power scheme GUIDs: USB settings subgroup and its USB selective suspend setting
+USB_SETTINGS_GUID = "2a737441-1930-4402-8d77-b2bebba308a3"
+USB_SELECTIVE_SUSPEND_GUID = "48e6b7a6-50f5-4782-a5d4-53bb8f07e226"
+
+
+class _GUID(ctypes.Structure):
+    _fields_ = [
+        ("Data1", ctypes.c_ulong),
+        ("Data2", ctypes.c_ushort),
+        ("Data3", ctypes.c_ushort),
+        ("Data4", ctypes.c_ubyte * 8),
+    ]
+
+    @classmethod
+    def from_string(cls, value: str) -> "_GUID":
+        guid = cls()
+        ctypes.memmove(ctypes.byref(guid), uuid.UUID(value).bytes_le, ctypes.sizeof(guid))
+        return guid
+
+
+def _disable_usb_selective_suspend_native() -> bool:
+    """Set USB selective suspend to 0 on the active scheme via powrprof.dll (no powercfg spawn)."""
+    powrprof = ctypes.WinDLL("powrprof")
+    kernel32 = ctypes.WinDLL("kernel32")
+    scheme = ctypes.POINTER(_GUID)()
+    if powrprof.PowerGetActiveScheme(None, ctypes.byref(scheme)) != 0:
+        return False
+    try:
+        subgroup = _GUID.from_string(USB_SETTINGS_GUID)
+        setting = _GUID.from_string(USB_SELECTIVE_SUSPEND_GUID)
+        if powrprof.PowerWriteACValueIndex(None, scheme, ctypes.byref(subgroup), ctypes.byref(setting), 0) != 0:
+            return False
+        return powrprof.PowerSetActiveScheme(None, scheme) == 0
+    finally:
+        kernel32.LocalFree(scheme)
+
+
 def disable_usb_selective_suspend():
     """Disable USB selective suspend to prevent Windows from disconnecting USB devices.
     This is a common cause of camera disconnections on laptops.
     """
+    try:
+        if _disable_usb_selective_suspend_native():
+            write_log("✓ USB selective suspend disabled (prevents camera disconnects)")
+            return True
+    except Exception as e:
+        write_log(f"powrprof unavailable, falling back to powercfg: {e}")
     try:
         # Disable USB selective suspend on current power scheme
-        # GUID 2a737441-1930-4402-8d77-b2bebba308a3 is USB settings
-        # Sub-GUID 48e6b7a6-50f5-4782-a5d4-53bb8f07e226 is USB selective suspend
         result = subprocess.run(
             ["powercfg", "/SETACVALUEINDEX", "SCHEME_CURRENT", 
-             "2a737441-1930-4402-8d77-b2bebba308a3", 
-             "48e6b7a6-50f5-4782-a5d4-53bb8f07e226", "0"],
-            capture_output=True, timeout=10
+             USB_SETTINGS_GUID, USB_SELECTIVE_SUSPEND_GUID, "0"],
+            capture_output=True, timeout=10, creationflags=NO_WINDOW
         )
         if result.returncode == 0:
             # Apply changes
             subprocess.run(["powercfg", "/SETACTIVE", "SCHEME_CURRENT"], 
-                          capture_output=True, timeout=10)
+                          capture_output=True, timeout=10, creationflags=NO_WINDOW)
             write_log("✓ USB selective suspend disabled (prevents camera disconnects)")
             return True
     except Exception as e:
@@ -218,58 +451,188 @@ def disable_usb_selective_suspend():
     return False
 
 
-def run_command(cmd, timeout=10, shell=False):
-    """Run a command and return (returncode, stdout, stderr)."""
+# What text=True would decode child output with (the ANSI code page on Windows)
+_CONSOLE_ENCODING = locale.getpreferredencoding(False)
+
+
+def run_command(cmd, timeout=10, shell=False, creationflags=NO_WINDOW, capture=True,
+                encoding: Optional[str] = None):
+    """Run a command and return (returncode, stdout, stderr).
+    With capture=False output goes to DEVNULL and stdout/stderr come back empty.
+    Output is read as bytes and decoded once, leniently, with encoding (default: the
+    console code page); wsl.exe's own messages need "utf-16-le".
+    """
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, shell=shell)
-        return result.returncode, result.stdout, result.stderr
+        if not capture:
+            rc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                timeout=timeout, shell=shell, creationflags=creationflags).returncode
+            return rc, "", ""
+        result = subprocess.run(cmd, capture_output=True, timeout=timeout, shell=shell,
+                                creationflags=creationflags)
+        enc = encoding or _CONSOLE_ENCODING
+        return (result.returncode, result.stdout.decode(enc, "replace"),
+                result.stderr.decode(enc, "replace"))
     except subprocess.TimeoutExpired:
         return -1, "", f"Timeout after {timeout}s"
     except Exception as e:
         return -2, "", str(e)
 
 
+# Short-lived cache of 'usbipd list' output so tight polling loops reuse one spawn
+_usbipd_list_cache = {"ts": 0.0, "out": None}
+
+
+def _usbipd_list(ttl: float = 0.5):
+    """Return (returncode, stdout, stderr) of 'usbipd list', reusing output younger than ttl seconds."""
+    cached = _usbipd_list_cache["out"]
+    if cached is not None and time.monotonic() - _usbipd_list_cache["ts"] < ttl:
+        return cached
+    result = run_command([USBIPD_EXE, "list"], timeout=8)
+    if result[0] == 0:
+        _usbipd_list_cache["out"] = result
+        _usbipd_list_cache["ts"] = time.monotonic()
+    return result
+
+
+def _invalidate_usbipd_list():
+    """Drop cached 'usbipd list' output after an operation that changes device state."""
+    _usbipd_list_cache["ts"] = 0.0
+    _usbipd_list_cache["out"] = None
+
+
 def _ps_escape(arg: str) -> str:
     """Escape a string for PowerShell single-quoted context."""
     return str(arg).replace("'", "''")
 
 
+_elevated_script_seq = 0
+
+
 def run_powershell_elevated(ps_command: str) -> bool:
     """Prompt for UAC and run a PowerShell command elevated (no output captured)."""
-    # This launches: powershell.exe -NoProfile -WindowStyle Hidden -Command <ps_command>
-    # with elevation via Start-Process -Verb RunAs from a non-elevated shell.
+    # The command is written verbatim to a temp .ps1 and launched with -File, so it is
+    # never re-quoted into a nested -Command string. The script deletes itself when done.
     # We cannot capture output; caller should verify by polling state.
+    global _elevated_script_seq
+    _elevated_script_seq += 1
+    script = os.path.join(TEMP_DIR, f"elev_{os.getpid()}_{_elevated_script_seq}.ps1")
+    try:
+        with open(script, "w", encoding="utf-8-sig") as f:
+            f.write(ps_command + "\n")
+            f.write("Remove-Item -LiteralPath $PSCommandPath -Force -ErrorAction SilentlyContinue\n")
+    except OSError as e:
+        write_log(f"Could not write elevation script: {e}")
+        return False
+
     bootstrap = (
-        "Start-Process -Verb RunAs -FilePath 'powershell' "
-        "-ArgumentList '-NoProfile','-WindowStyle','Hidden','-Command'," +
-        f"'" + _ps_escape(ps_command) + "' "
-        "-WindowStyle Hidden"
+        "Start-Process -Verb RunAs -FilePath 'powershell' -WindowStyle Hidden "
+        "-ArgumentList @('-NoProfile','-ExecutionPolicy','Bypass','-WindowStyle','Hidden','-File',"
+        f"'\"{_ps_escape(script)}\"')"
     )
     write_log("Requesting elevation (UAC) for PowerShell command...")
     rc, out, err = run_command(["powershell", "-NoProfile", "-Command", bootstrap], timeout=8)
     if rc != 0:
         write_log(f"Elevation bootstrap failed rc={rc}: {err.strip()}")
+        try:
+            os.remove(script)
+        except OSError:
+            pass
         return False
     return True
 
 
-def ensure_wsl_running():
-    """Start WSL distro if not running."""
-    try:
-        run_command(["wsl", "-d", WSL_DISTRO, "--", "bash", "-lc", "exit"], timeout=5)
-        return True
-    except Exception:
-        return False
+class WSLShell:
+    """Long-lived 'wsl -d <distro> -- bash' process that runs commands fed over stdin.
+    Avoids paying wsl.exe startup and distro/profile initialisation for every short probe.
+    stderr of each command is merged into its stdout.
+    """
+
+    def __init__(self, distro: Optional[str] = WSL_DISTRO):
+        self.distro = distro
+        self.proc: Optional[subprocess.Popen] = None
+        self.lock = threading.Lock()
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._seq = 0
+
+    def _start(self):
+        self.proc = subprocess.Popen(
+            (["wsl", "-d", self.distro] if self.distro else ["wsl"]) + ["--", "bash"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0,
+            creationflags=NO_WINDOW,
+        )
+        # Windows pipes cannot be select()ed, so a reader thread feeds a queue
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self.proc, self._lines), daemon=True).start()
+
+    @staticmethod
+    def _pump(proc: subprocess.Popen, lines: queue.Queue):
+        for raw in iter(proc.stdout.readline, b""):
+            lines.put(raw.decode("utf-8", "replace"))
+        lines.put(None)  # EOF: shell exited
+
+    def close(self):
+        """Terminate the shell; the next run() starts a fresh one."""
+        proc, self.proc = self.proc, None
+        if proc and proc.poll() is None:
+            try:
+                proc.kill()
+            except Exception:
+                pass
+
+    def run(self, cmd: str, timeout: float = 10):
+        """Run cmd in the shell and return (returncode, output, error)."""
+        with self.lock:
+            self._seq += 1
+            marker = f"__END_{self._seq}__"
+            line_in = f"{{ {cmd}\n}} </dev/null 2>&1; echo {marker}$?\n".encode()
+            try:
+                # Watchdog: restart the shell if it died (e.g. after wsl --shutdown)
+                if self.proc is None or self.proc.poll() is not None:
+                    self._start()
+                self.proc.stdin.write(line_in)
+                self.proc.stdin.flush()
+            except Exception as e:
+                self.close()
+                return -2, "", str(e)
+
+            out = []
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.close()
+                    return -1, "".join(out), f"Timeout after {timeout}s"
+                try:
+                    line = self._lines.get(timeout=remaining)
+                except queue.Empty:
+                    continue
+                if line is None:
+                    self.close()
+                    return -2, "".join(out), "WSL shell exited"
+                if marker in line:
+                    head, _, rc = line.partition(marker)
+                    out.append(head)
+                    output = "".join(out)
+                    rc = int(rc.strip() or 1)
+                    return rc, output, output if rc != 0 else ""
+                out.append(line)
+
+
+_wsl_shell = WSLShell(WSL_DISTRO)
+atexit.register(_wsl_shell.close)
+
+
+def ensure_wsl_running(timeout: float = WSL_START_TIMEOUT):
+    """Start WSL distro if not running (a cold start can take tens of seconds)."""
+    rc, _, _ = _wsl_shell.run("true", timeout=timeout)
+    return rc == 0
 
 
 def load_wsl_usb_modules() -> bool:
     """Load required USB kernel modules in WSL for usbip to work."""
     write_log("Loading USB kernel modules in WSL...")
     # Load vhci-hcd module (required for USB/IP client)
-    rc, stdout, stderr = run_command(
-        ["wsl", "-d", WSL_DISTRO, "--", "bash", "-lc", "sudo modprobe vhci-hcd 2>/dev/null || true"],
-        timeout=10
-    )
+    rc, stdout, stderr = _wsl_shell.run("sudo modprobe vhci-hcd 2>/dev/null || true", timeout=10)
     if rc == 0:
         write_log("USB modules loaded (or already loaded)")
         return True
@@ -281,11 +644,8 @@ def load_wsl_usb_modules() -> bool:
 def check_wsl_usbip_ready() -> bool:
     """Check if WSL is ready to receive USB devices."""
     write_log("Checking if WSL USB/IP is ready...")
-    rc, stdout, stderr = run_command(
-        ["wsl", "-d", WSL_DISTRO, "--", "bash", "-lc", "ls /sys/devices/platform/vhci_hcd.0 2>/dev/null && echo READY"],
-        timeout=8
-    )
-    if "READY" in stdout:
+    rc, _, _ = _wsl_shell.run("test -e /sys/devices/platform/vhci_hcd.0", timeout=4)
+    if rc == 0:
         write_log("WSL USB/IP subsystem is ready")
         return True
     else:
@@ -293,72 +653,105 @@ def check_wsl_usbip_ready() -> bool:
         return load_wsl_usb_modules()
 
 
-def get_camera_busid():
-    """Query usbipd and return camera BusID, or None if not found."""
-    if not os.path.exists(USBIPD_EXE):
+# One 'usbipd list' device row: BUSID, VID:PID, device name, share state
+_USBIPD_RE = re.compile(
+    r'^\s*(\d+-\d+)\s+([0-9a-f]{4}:[0-9a-f]{4})\s+(.*?)\s{2,}(Not shared|Shared|Attached)',
+    re.I | re.M,
+)
+_USBIPD_STATES = {"attached": "attached", "shared": "shared", "not shared": "not-shared"}
+
+# 'gphoto2 --auto-detect' rows: a USB PTP camera (model, port), or any non-header row
+_GPHOTO_USB_RE = re.compile(r'^\s*(.+?)\s+(usb:\S*)\s*$', re.M)
+_GPHOTO_ROW_RE = re.compile(r'^(?!\s*(?:model|-))\s*(\S.*?)\s*$', re.I | re.M)
+
+# USB vendor IDs of gphoto2-supported camera makers, for the sysfs connect probe
+KNOWN_CAMERAS = {"04b0": "Nikon Corp.", "04a9": "Canon Inc.", "054c": "Sony Corp."}
+# One line per USB device: idVendor idProduct busnum devnum [product string]
+_USB_SYSFS_LIST = ('for d in /sys/bus/usb/devices/*; do [ -f "$d/idVendor" ] && '
+                   'echo "$(cat "$d/idVendor") $(cat "$d/idProduct") $(cat "$d/busnum") '
+                   '$(cat "$d/devnum") $(cat "$d/product" 2>/dev/null)"; done; true')
+
+
+def _iter_usbipd_devices(stdout: str):
+    """Yield (busid, vid_pid, device_name, state) for each connected device row."""
+    for m in _USBIPD_RE.finditer(stdout):
+        yield m.group(1), m.group(2).lower(), m.group(3), _USBIPD_STATES[m.group(4).lower()]
+
+
+def get_camera_info() -> tuple[Optional[str], str]:
+    """Walk 'usbipd list' once and return (busid, state) for the camera.
+    busid is None and state is 'unknown' if the camera is not connected.
+    """
+    if not _USBIPD_PRESENT:
         write_log("ERROR: usbipd-win not found at " + USBIPD_EXE)
-        return None
+        return None, "unknown"
 
-    rc, stdout, stderr = run_command([USBIPD_EXE, "list"], timeout=8)
+    rc, stdout, stderr = _usbipd_list()
     if rc != 0:
         write_log(f"usbipd list failed: {stderr}")
-        return None
-
-    # Look for camera in "Connected:" section only
-    in_connected_section = False
-    for line in stdout.splitlines():
-        if line.strip().lower().startswith("connected:"):
-            in_connected_section = True
-            continue
-        if line.strip().lower().startswith("persisted:"):
-            in_connected_section = False
-            continue
-        
-        if not in_connected_section:
-            continue
-            
-        line_lower = line.lower()
-        if CAMERA_DEVICE_NAME.lower() in line_lower or CAMERA_VID_PID.lower() in line_lower:
-            write_log(f"Found camera: {line.strip()}")
-            # Extract BusID
-            tokens = line.split()
-            for tok in tokens:
-                if '-' in tok:
-                    parts = tok.split('-')
-                    if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
-                        return tok
+        return None, "unknown"
+
+    # Only rows with a BusID match, so persisted entries are skipped implicitly
+    vid_pid = CAMERA_VID_PID.lower()
+    name = CAMERA_DEVICE_NAME.lower()
+    for busid, dev_vid_pid, dev_name, state in _iter_usbipd_devices(stdout):
+        if dev_vid_pid == vid_pid or name in dev_name.lower():
+            write_log(f"Found camera: {busid} {dev_vid_pid} {dev_name} ({state})")
+            return busid, state
     
     write_log("Camera not found in connected devices. Is the camera plugged in and turned on?")
-    return None
+    return None, "unknown"
+
+
+def get_camera_busid():
+    """Query usbipd and return camera BusID, or None if not found."""
+    return get_camera_info()[0]
 
 
 def get_camera_state(busid: str) -> str:
     """Return camera state: 'not-shared', 'shared', 'attached', or 'unknown'."""
-    if not os.path.exists(USBIPD_EXE):
+    if not _USBIPD_PRESENT:
         return "unknown"
 
-    rc, stdout, stderr = run_command([USBIPD_EXE, "list"], timeout=8)
+    rc, stdout, stderr = _usbipd_list()
     if rc != 0:
         return "unknown"
 
-    for line in stdout.splitlines():
-        if busid in line:
-            if "Attached" in line:
-                return "attached"
-            elif "Shared" in line:
-                return "shared"
-            elif "Not shared" in line:
-                return "not-shared"
+    for dev_busid, _, _, state in _iter_usbipd_devices(stdout):
+        if dev_busid == busid:
+            return state
     return "unknown"
 
 
+def _wait_for_state(busid: str, targets, timeout: float, initial: float = 0.1,
+                    cap: float = 2.0, give_up=None) -> bool:
+    """Poll camera state with exponential backoff until it is one of targets.
+    Returns True as soon as a target state is seen, False on timeout or when give_up() is true.
+    """
+    if isinstance(targets, str):
+        targets = (targets,)
+    delay = initial
+    deadline = time.monotonic() + timeout
+    while True:
+        if get_camera_state(busid) in targets:
+            return True
+        if give_up is not None and give_up():
+            return False
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 1.5, cap)
+
+
 def bind_camera(busid: str) -> bool:
     """Bind camera (changes 'Not shared' → 'Shared')."""
-    if not os.path.exists(USBIPD_EXE):
+    if not _USBIPD_PRESENT:
         return False
 
     write_log(f"usbipd bind --busid {busid}")
     rc, stdout, stderr = run_command([USBIPD_EXE, "bind", "--busid", busid], timeout=15)
+    _invalidate_usbipd_list()
     
     if rc == 0:
         write_log(f"bind successful")
@@ -369,19 +762,17 @@ def bind_camera(busid: str) -> bool:
         # Try elevated bind
         ps_cmd = f"Start-Process -FilePath '{_ps_escape(USBIPD_EXE)}' -ArgumentList 'bind --busid {_ps_escape(busid)}' -Wait"
         if run_powershell_elevated(ps_cmd):
+            _invalidate_usbipd_list()
             # Poll state for up to 10 seconds
-            for _ in range(10):
-                time.sleep(1)
-                st = get_camera_state(busid)
-                if st in ("shared", "attached"):
-                    write_log("bind successful (elevated)")
-                    return True
+            if _wait_for_state(busid, ("shared", "attached"), timeout=10):
+                write_log("bind successful (elevated)")
+                return True
         return False
 
 
 def attach_camera(busid: str) -> bool:
     """Attach camera to WSL (requires --wsl flag in usbipd 5.x)."""
-    if not os.path.exists(USBIPD_EXE):
+    if not _USBIPD_PRESENT:
         return False
 
     cmd = [USBIPD_EXE, "attach", "--wsl", WSL_DISTRO, "--busid", busid]
@@ -391,6 +782,7 @@ def attach_camera(busid: str) -> bool:
     
     # Use longer timeout (90s) since attach can be slow
     rc, stdout, stderr = run_command(cmd, timeout=90)
+    _invalidate_usbipd_list()
     
     if rc == 0:
         write_log(f"attach successful")
@@ -410,7 +802,7 @@ def attach_camera(busid: str) -> bool:
 
 def attach_camera_auto(busid: str) -> bool:
     """Start auto-attach in background and poll for success."""
-    if not os.path.exists(USBIPD_EXE):
+    if not _USBIPD_PRESENT:
         return False
     
     write_log(f"Starting auto-attach for busid {busid}...")
@@ -421,22 +813,24 @@ def attach_camera_auto(busid: str) -> bool:
     
     proc = subprocess.Popen(
         cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+        stdout=subprocess.DEVNULL,  # never read; a full pipe would stall --auto-attach
+        stderr=subprocess.DEVNULL,
+        creationflags=NO_WINDOW
     )
+    _invalidate_usbipd_list()
     
-    # Poll for camera to become attached (up to 60 seconds)
-    for i in range(30):
-        time.sleep(2)
-        state = get_camera_state(busid)
-        write_log(f"auto-attach poll {i+1}/30: state={state}")
-        if state == "attached":
-            write_log("auto-attach: camera attached!")
-            return True
+    # Poll for camera to become attached (up to 60 seconds). A thread blocked in
+    # proc.wait() flags an early exit so we stop polling instead of checking poll()
+    exited = run_in_background(proc.wait)
+    if _wait_for_state(busid, "attached", timeout=60, give_up=exited.done):
+        write_log("auto-attach: camera attached!")
+        return True
+    if exited.done():
+        write_log(f"auto-attach: usbipd exited early with code {proc.returncode}")
+    write_log(f"auto-attach: gave up, state={get_camera_state(busid)}")
     
     # Kill background process if still running
-    if proc.poll() is None:
+    if not exited.done():
         write_log("auto-attach: terminating background process...")
         proc.terminate()
         try:
@@ -449,11 +843,12 @@ def attach_camera_auto(busid: str) -> bool:
 
 def detach_camera(busid: str) -> bool:
     """Detach camera from any client (safe to call if not attached)."""
-    if not os.path.exists(USBIPD_EXE):
+    if not _USBIPD_PRESENT:
         return False
 
     write_log(f"usbipd detach --busid {busid}")
     rc, stdout, stderr = run_command([USBIPD_EXE, "detach", "--busid", busid], timeout=12)
+    _invalidate_usbipd_list()
     if rc == 0:
         write_log("detach successful or not attached")
         return True
@@ -462,20 +857,28 @@ def detach_camera(busid: str) -> bool:
         # Try elevated detach
         ps_cmd = f"Start-Process -FilePath '{_ps_escape(USBIPD_EXE)}' -ArgumentList 'detach --busid {_ps_escape(busid)}' -Wait"
         if run_powershell_elevated(ps_cmd):
+            _invalidate_usbipd_list()
             # Poll until not attached
-            for _ in range(10):
-                time.sleep(1)
-                st = get_camera_state(busid)
-                if st in ("shared", "not-shared", "unknown"):
-                    write_log("detach successful (elevated)")
-                    return True
+            if _wait_for_state(busid, ("shared", "not-shared", "unknown"), timeout=10):
+                write_log("detach successful (elevated)")
+                return True
         return False
 
 
 def restart_usbipd_service() -> None:
     """Best-effort restart of usbipd service. Requires elevation; logs outcome."""
+    # Try the Service Control Manager directly (no PowerShell spawn)
+    try:
+        import win32serviceutil
+        win32serviceutil.RestartService("usbipd")
+        _invalidate_usbipd_list()
+        write_log("usbipd service restarted")
+        return
+    except Exception as e:
+        write_log(f"RestartService usbipd failed: {e}")
     # Try PowerShell Restart-Service
     rc, out, err = run_command(["powershell", "-NoProfile", "-Command", "Restart-Service -Name usbipd -ErrorAction SilentlyContinue"], timeout=8)
+    _invalidate_usbipd_list()
     if rc == 0:
         write_log("usbipd service restart attempted")
         return
@@ -483,14 +886,15 @@ def restart_usbipd_service() -> None:
     # Try elevated PowerShell to restart the service
     if not run_powershell_elevated("Restart-Service -Name usbipd -Force"):
         # Fallback to sc stop/start (non-elevated may fail)
-        run_command(["sc.exe", "stop", "usbipd"], timeout=6)
+        run_command(["sc.exe", "stop", "usbipd"], timeout=6, capture=False)
         time.sleep(1)
-        run_command(["sc.exe", "start", "usbipd"], timeout=6)
+        run_command(["sc.exe", "start", "usbipd"], timeout=6, capture=False)
+    _invalidate_usbipd_list()
 
 
 def shutdown_wsl() -> None:
     """Shut down all WSL instances (best-effort)."""
-    rc, out, err = run_command(["wsl", "--shutdown"], timeout=10)
+    rc, out, err = run_command(["wsl", "--shutdown"], timeout=10, encoding="utf-16-le")
     if rc != 0:
         write_log(f"wsl --shutdown rc={rc}: {err.strip()}")
     else:
@@ -499,7 +903,7 @@ def shutdown_wsl() -> None:
 
 def usbipd_state_json() -> Optional[dict]:
     """Return parsed json from 'usbipd state', or None."""
-    if not os.path.exists(USBIPD_EXE):
+    if not _USBIPD_PRESENT:
         return None
     rc, stdout, stderr = run_command([USBIPD_EXE, "state"], timeout=8)
     if rc != 0:
@@ -548,11 +952,11 @@ def robust_attach_camera(busid: str, max_attempts: int = 2) -> bool:
         # Fallback sequence
         write_log("attach failed; running fallback: detach → restart usbipd → wsl --shutdown/start → re-bind")
         detach_camera(busid)
-        write_log("Waiting 2s after detach...")
-        time.sleep(2)
+        write_log("Waiting up to 2s for detach...")
+        _wait_for_state(busid, ("shared", "not-shared"), timeout=2)
         restart_usbipd_service()
-        write_log("Waiting 3s after service restart...")
-        time.sleep(3)
+        write_log("Waiting up to 3s for usbipd service...")
+        _wait_for_state(busid, ("shared", "not-shared", "attached"), timeout=3)
         shutdown_wsl()
         write_log("Waiting 5s after WSL shutdown...")
         time.sleep(5)
@@ -595,37 +999,40 @@ def robust_attach_camera(busid: str, max_attempts: int = 2) -> bool:
 
 def attach_camera_nonblocking(busid: str) -> bool:
     """Try to attach camera using PowerShell Start-Process (non-blocking with polling)."""
-    if not os.path.exists(USBIPD_EXE):
+    if not _USBIPD_PRESENT:
         return False
     
     # Start the attach process in background via PowerShell
     ps_cmd = f"Start-Process -FilePath '{_ps_escape(USBIPD_EXE)}' -ArgumentList 'attach','--wsl','{WSL_DISTRO}','--busid','{busid}' -NoNewWindow -Wait"
     write_log(f"Starting attach via PowerShell: {ps_cmd[:80]}...")
     
-    # Run PowerShell in background and poll for state change
+    # Run PowerShell in background (output is never read, so don't pipe it)
     proc = subprocess.Popen(
         ["powershell", "-NoProfile", "-Command", ps_cmd],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        creationflags=NO_WINDOW
     )
+    _invalidate_usbipd_list()
     
-    # Poll for up to 45 seconds
-    start_time = time.time()
-    while time.time() - start_time < 45:
-        # Check if process finished
-        poll_result = proc.poll()
-        if poll_result is not None:
-            write_log(f"PowerShell attach process finished with code {poll_result}")
-            break
-        
-        # Check camera state
-        state = get_camera_state(busid)
-        if state == "attached":
-            write_log("Camera attached while polling!")
-            proc.terminate()
-            return True
-        
-        time.sleep(2)
+    # Block on whichever comes first: the process exiting or the camera reaching
+    # "attached", for up to 45 seconds. The process exit is the primary signal; the
+    # watcher backs off 0.5s -> 2s, so over 45s it spawns about as many 'usbipd list'
+    # as fixed 2s polling while still noticing a quick attach early
+    stop = threading.Event()
+    proc_future = run_in_background(proc.wait)
+    state_future = run_in_background(
+        _wait_for_state, busid, "attached", 45, 0.5, 2.0,
+        lambda: stop.is_set() or proc_future.done())
+    concurrent.futures.wait([proc_future, state_future], timeout=45,
+                            return_when=concurrent.futures.FIRST_COMPLETED)
+    stop.set()
+    if state_future.done() and state_future.result():
+        write_log("Camera attached while polling!")
+        proc.terminate()
+        return True
+    if proc.poll() is not None:
+        write_log(f"PowerShell attach process finished with code {proc.returncode}")
     
     # Kill process if still running
     if proc.poll() is None:
@@ -641,12 +1048,12 @@ def attach_camera_nonblocking(busid: str) -> bool:
     return state == "attached"
 
 
-def gphoto2_detect() -> bool:
+def gphoto2_detect(timeout: int = 12) -> bool:
     """Run gphoto2 --auto-detect inside WSL and check for camera."""
-    rc, stdout, stderr = run_command(
-        ["wsl", "-d", WSL_DISTRO, "--", "bash", "-lc", "gphoto2 --auto-detect"],
-        timeout=12
-    )
+    # coreutils timeout ends a hung gphoto2 inside WSL, so the persistent shell
+    # survives; the outer limit only catches a shell that is itself stuck
+    rc, stdout, stderr = _wsl_shell.run(f"timeout {timeout} gphoto2 --auto-detect",
+                                        timeout=timeout + 5)
     
     write_log(f"gphoto2 --auto-detect rc={rc}")
     write_log(f"gphoto2 output: {stdout.strip()}")
@@ -654,27 +1061,54 @@ def gphoto2_detect() -> bool:
     if rc != 0:
         return False
 
-    for ln in stdout.splitlines():
-        if ln.strip() and not ln.lower().startswith('model') and not ln.strip().startswith('-'):
-            write_log("gphoto2 detected camera!")
-            return True
+    if _GPHOTO_ROW_RE.search(stdout):
+        write_log("gphoto2 detected camera!")
+        return True
     return False
 
 
+def camera_usb_present(timeout: int = 5) -> bool:
+    """Is the camera on WSL's USB bus? Reads sysfs uevents only, so unlike
+    gphoto2 --auto-detect it sends nothing to the camera."""
+    vid, pid = (int(part, 16) for part in CAMERA_VID_PID.split(":"))
+    rc, _, _ = _wsl_shell.run(
+        f"grep -qis '^PRODUCT={vid:x}/{pid:x}/' /sys/bus/usb/devices/*/uevent", timeout=timeout)
+    return rc == 0
+
+
 def fully_automated_camera_setup() -> bool:
     """Complete automation: Bind → Attach → Detect. Returns True if camera ready."""
     write_log("\n" + "="*60)
     write_log("STARTING FULLY AUTOMATED CAMERA SETUP")
     write_log("="*60)
 
-    # Step 1: Ensure WSL is running
-    write_log("\nStep 1: Ensuring WSL is running...")
-    if not ensure_wsl_running():
-        write_log("WARNING: WSL may not have started, continuing anyway")
+    # Fast path: camera still attached from a previous run and gphoto2 answers
+    # WSL is brought up first, with its own generous limit: on a cold start the 3s
+    # detect budget would otherwise expire during WSL boot and kill the shell
+    busid, state = get_camera_info()
+    if state == "attached" and ensure_wsl_running() and gphoto2_detect(timeout=3):
+        write_log("fast-path: camera already attached")
+        return True
 
-    # Step 2: Get camera BusID
+    # Steps 1-2: the WSL calls share the one persistent shell (they run one at a
+    # time under its lock), while the usbipd query is a Windows-side process. So
+    # boot WSL and then check USB/IP in order on one worker, and overlap only the
+    # usbipd query with them. Booting first matters: check_wsl_usbip_ready's short
+    # timeout would otherwise expire during a cold boot and kill the shell.
+    write_log("\nStep 1: Ensuring WSL is running and USB/IP is ready...")
     write_log("\nStep 2: Finding camera BusID via usbipd...")
-    busid = get_camera_busid()
+
+    def prepare_wsl():
+        if not ensure_wsl_running():
+            write_log("WARNING: WSL may not have started, continuing anyway")
+        check_wsl_usbip_ready()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        wsl_future = pool.submit(prepare_wsl)
+        info_future = pool.submit(get_camera_info)
+        wsl_future.result()
+        busid, state = info_future.result()
+
     if not busid:
         write_log("ERROR: Camera not found in usbipd list")
         return False
@@ -682,7 +1116,6 @@ def fully_automated_camera_setup() -> bool:
 
     # Step 3: Check and bind if needed
     write_log("\nStep 3: Checking camera share state...")
-    state = get_camera_state(busid)
     write_log(f"Current state: {state}")
 
     if state == "not-shared":
@@ -717,6 +1150,18 @@ def fully_automated_camera_setup() -> bool:
 # CAMERA INTERFACE
 # ============================================================================
 
+@dataclass
+class CaptureResult:
+    """Outcome of one capture; truthy when the shot succeeded."""
+    ok: bool
+    path: str
+    size: int = 0          # bytes written, as seen by the camera backend
+    elapsed: float = 0.0   # seconds from trigger to file complete
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+
 class CameraInterface(ABC):
     @abstractmethod
     def connect(self) -> bool: ...
@@ -725,10 +1170,150 @@ class CameraInterface(ABC):
     @abstractmethod
     def is_connected(self) -> bool: ...
     @abstractmethod
-    def capture(self, save_path: str) -> bool: ...
+    def capture(self, save_path: str) -> "CaptureResult": ...
     @abstractmethod
     def get_name(self) -> str: ...
 
+    def prepare(self):
+        """Get ready for a capture that is about to happen (best-effort, may block)."""
+
+
+class GPhotoSession:
+    """Long-lived 'gphoto2 --shell' inside WSL, so each shot skips gphoto2 start-up and
+    camera re-enumeration. Files are saved under their camera name in save_dir.
+    """
+
+    _SAVED_RE = re.compile(r"Saving file as ([^\r\n]+)")
+    _PROMPT_RE = re.compile(r"> $")  # Buffer ends at a prompt: the shell is idle
+
+    def __init__(self, prefix: list, port: Optional[str], save_dir: str):
+        self.save_dir = save_dir
+        port_args = ["--port", port] if port else []
+        self.proc = subprocess.Popen(
+            prefix + ["-e", GPHOTO_CMD, *port_args, "--shell", "--force-overwrite",
+                      "--filename", windows_path_to_wsl(save_dir) + "/%f.%C"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0,
+            creationflags=NO_WINDOW,
+        )
+        self._buf = ""
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()  # One command in flight: capture or ping
+        threading.Thread(target=self._pump, daemon=True).start()
+
+    def _pump(self):
+        # The shell prompt has no trailing newline, so read raw chunks instead of lines
+        fd = self.proc.stdout.fileno()
+        while True:
+            try:
+                chunk = os.read(fd, 4096)
+            except OSError:
+                chunk = b""
+            with self._cond:
+                if not chunk:
+                    self._buf += "\0"  # EOF marker
+                    self._cond.notify_all()
+                    return
+                self._buf += chunk.decode("utf-8", "replace")
+                self._cond.notify_all()
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def _wait_prompt(self, deadline: float) -> bool:
+        """With _cond held: wait until the output ends at a prompt (False on EOF/timeout)."""
+        while not self._PROMPT_RE.search(self._buf):
+            remaining = deadline - time.monotonic()
+            if "\0" in self._buf or remaining <= 0:
+                return False
+            self._cond.wait(remaining)
+        return True
+
+    def ping(self, timeout: float = 5) -> bool:
+        """Cheap camera round-trip ('ls' of the root folder) through the open session."""
+        with self._io_lock:
+            deadline = time.monotonic() + timeout
+            with self._cond:
+                # A fresh session prints its first prompt only once the shell is up;
+                # writing before that would let the start-up prompt pass for the answer
+                if not self._wait_prompt(deadline):
+                    return False
+                self._buf = ""
+            try:
+                self.proc.stdin.write(b"ls\n")
+                self.proc.stdin.flush()
+            except OSError:
+                return False
+            with self._cond:
+                # The buffer was cleared at an idle prompt, so the next prompt can only
+                # be the one printed after the 'ls' output
+                return self._wait_prompt(deadline) and "*** Error" not in self._buf
+
+    def capture(self, timeout: float = 30) -> Optional[str]:
+        """Capture one image; returns the Windows path it was saved to, or None."""
+        with self._io_lock:
+            return self._capture(timeout)
+
+    def _capture(self, timeout: float) -> Optional[str]:
+        with self._cond:
+            # Let any earlier command's output finish first (best-effort: a shot is
+            # still attempted without a prompt), so none of it lands in this buffer
+            self._wait_prompt(time.monotonic() + 5)
+            self._buf = ""
+        try:
+            self.proc.stdin.write(b"capture-image-and-download\n")
+            self.proc.stdin.flush()
+        except OSError:
+            return None
+
+        deadline = time.monotonic() + timeout
+        saved_at = None
+        last_size, stable = 0, 0
+        with self._cond:
+            while True:
+                names = self._SAVED_RE.findall(self._buf)
+                if "\0" in self._buf or "*** Error" in self._buf:
+                    # Let the error text arrive before logging it
+                    self._cond.wait(0.2)
+                    write_log(f"[gphoto2 shell] {self._buf.strip()[-200:]}")
+                    return None
+                if names:
+                    saved_at = saved_at or time.monotonic()
+                    tail = self._buf[self._buf.rfind(names[-1]):]
+                    # The prompt after the last "Saving file as" means the download finished
+                    if self._PROMPT_RE.search(tail):
+                        break
+                    # If readline prints no prompt on a pipe, watch the file instead: it is
+                    # already being written, so check often and accept two equal sizes
+                    size = _file_size(self._local_path(names[-1]))
+                    stable = stable + 1 if size and size == last_size else 0
+                    last_size = size
+                    if stable >= 2 or time.monotonic() - saved_at > 2.0:
+                        break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    write_log("[gphoto2 shell] capture timed out")
+                    return None
+                # Until "Saving file as" there is nothing to poll; output wakes us
+                self._cond.wait(min(remaining, 0.05) if names else remaining)
+
+        # RAW+JPEG shoots save two files; the booth only uses the JPEG
+        names = [n.strip() for n in names]
+        jpgs = [n for n in names if n.lower().endswith((".jpg", ".jpeg"))]
+        return self._local_path((jpgs or names)[0])
+
+    def _local_path(self, wsl_name: str) -> str:
+        """Windows path of a file gphoto2 reported saving (always under save_dir)."""
+        return os.path.join(self.save_dir, wsl_name.strip().rsplit("/", 1)[-1])
+
+    def close(self):
+        if self.proc.poll() is None:
+            try:
+                self.proc.stdin.write(b"quit\n")
+                self.proc.stdin.flush()
+                self.proc.wait(timeout=3)
+            except Exception:
+                self.proc.kill()
+
 
 class WSLGPhotoCamera(CameraInterface):
     """Camera control via gphoto2 inside WSL"""
@@ -738,50 +1323,89 @@ class WSLGPhotoCamera(CameraInterface):
         self.camera_name = "USB PTP Class Camera"
         self.camera_port = None  # Store the USB port for explicit targeting
         self.connected = False
+        self.session: Optional[GPhotoSession] = None
+        # One-off commands go through a persistent WSL bash (shared for the default distro)
+        self.shell = _wsl_shell if distro == WSL_DISTRO else WSLShell(distro)
+        self._set_port(None)
+
+    def _set_port(self, port: Optional[str]):
+        """Remember the camera port and pre-build the one-shot capture argv for it."""
+        self.camera_port = port
+        # Explicit port fixes multi-interface cameras; capture only appends the filename
+        port_args = ["--port", port] if port else []
+        self._capture_cmd = self._wsl_prefix() + ["-e", GPHOTO_CMD, *port_args,
+                                                  "--capture-image-and-download", "--filename"]
 
     def _wsl_prefix(self):
         return ["wsl", "-d", self.distro] if self.distro else ["wsl"]
 
-    def _run_wsl(self, cmd: str, timeout: int = 20) -> subprocess.CompletedProcess:
-        full_cmd = self._wsl_prefix() + ["bash", "-lc", cmd]
+    def _run_wsl(self, cmd: Union[str, list], timeout: int = 20,
+                 capture: bool = True) -> subprocess.CompletedProcess:
+        # No wsl.exe launch per call: the command runs in the persistent shell.
+        # argv lists are quoted here so paths/ports can't break the command line.
+        if not isinstance(cmd, str):
+            cmd = " ".join(shlex.quote(str(a)) for a in cmd)
         write_log(f"[wsl] {cmd}")
-        try:
-            result = subprocess.run(full_cmd, capture_output=True, text=True, timeout=timeout)
-            if result.returncode != 0:
-                write_log(f"[wsl] rc={result.returncode} {result.stderr.strip()}")
-            return result
-        except subprocess.TimeoutExpired:
+        if not capture:
+            # Discard output inside WSL so nothing is shipped back over the pipe
+            cmd = f"{{ {cmd}\n}} >/dev/null 2>&1"
+        rc, out, err = self.shell.run(cmd, timeout=timeout)
+        if rc == -1:
             write_log(f"[wsl] TIMEOUT after {timeout}s")
-            return subprocess.CompletedProcess(full_cmd, 1, "", f"Timeout")
+            return subprocess.CompletedProcess(cmd, 1, out, "Timeout")
+        if rc != 0:
+            write_log(f"[wsl] rc={rc} {err.strip()}")
+        return subprocess.CompletedProcess(cmd, rc, out, err)
+
+    def _probe_usb(self) -> bool:
+        """Fast connect: find a known camera maker's device in sysfs and target its
+        usb:BBB,DDD port directly, without gphoto2 opening a PTP session."""
+        result = self._run_wsl(_USB_SYSFS_LIST, timeout=3)
+        if result.returncode != 0:
+            return False
+        wanted = CAMERA_VID_PID.lower()
+        best = None
+        for line in result.stdout.splitlines():
+            parts = line.split(None, 4)
+            if len(parts) < 4 or parts[0].lower() not in KNOWN_CAMERAS:
+                continue
+            # The configured camera wins over any other known maker's device
+            if best is None or f"{parts[0]}:{parts[1]}".lower() == wanted:
+                best = parts
+        if best is None:
+            return False
+        vid, _, bus, dev = best[:4]
+        self.camera_name = best[4].strip() if len(best) > 4 and best[4].strip() else KNOWN_CAMERAS[vid.lower()]
+        self._set_port(f"usb:{int(bus):03d},{int(dev):03d}")
+        self.connected = True
+        write_log(f"✓ Camera connected (usb): {self.camera_name} on {self.camera_port}")
+        return True
 
     def connect(self) -> bool:
         try:
             write_log("WSLGPhotoCamera: connecting...")
-            result = self._run_wsl(f"{GPHOTO_CMD} --auto-detect", timeout=10)
+            if self._probe_usb():
+                return True
+            # Unknown vendor or sysfs unreadable: let gphoto2 enumerate
+            result = self._run_wsl([GPHOTO_CMD, "--auto-detect"], timeout=10)
             
             if result.returncode == 0:
                 # Look for USB PTP camera first (preferred over Mass Storage)
-                for ln in result.stdout.splitlines():
-                    if ln.strip() and not ln.lower().startswith('model') and not ln.strip().startswith('-'):
-                        # Parse camera name and port
-                        parts = ln.strip().split()
-                        if len(parts) >= 2:
-                            port = parts[-1]  # Last column is the port
-                            # Prefer USB PTP over disk/mass storage
-                            if port.startswith('usb:'):
-                                self.camera_port = port
-                                self.camera_name = ' '.join(parts[:-1])
-                                self.connected = True
-                                write_log(f"✓ Camera connected: {self.camera_name} on {self.camera_port}")
-                                return True
+                m = _GPHOTO_USB_RE.search(result.stdout)
+                if m:
+                    self.camera_name = m.group(1)
+                    self._set_port(m.group(2))
+                    self.connected = True
+                    write_log(f"✓ Camera connected: {self.camera_name} on {self.camera_port}")
+                    return True
                 
                 # Fallback: accept any camera if no USB PTP found
-                for ln in result.stdout.splitlines():
-                    if ln.strip() and not ln.lower().startswith('model') and not ln.strip().startswith('-'):
-                        self.camera_name = ln.strip()
-                        self.connected = True
-                        write_log(f"✓ Camera connected (fallback): {self.camera_name}")
-                        return True
+                m = _GPHOTO_ROW_RE.search(result.stdout)
+                if m:
+                    self.camera_name = m.group(1)
+                    self.connected = True
+                    write_log(f"✓ Camera connected (fallback): {self.camera_name}")
+                    return True
             
             write_log("✗ Camera detection failed")
             return False
@@ -790,94 +1414,155 @@ class WSLGPhotoCamera(CameraInterface):
             return False
 
     def disconnect(self):
+        self._close_session()
         self.connected = False
-        self.camera_port = None
+        self._set_port(None)
 
     def is_connected(self) -> bool:
         return self.connected
 
-    def capture(self, save_path: str) -> bool:
+    def _close_session(self):
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+    def start_session(self, save_dir: str = CAPTURE_DIR):
+        """Start (or reuse) the persistent gphoto2 shell; returns immediately."""
+        if self.session is not None and (not self.session.alive() or self.session.save_dir != save_dir):
+            self._close_session()
+        if self.session is None:
+            write_log("starting persistent gphoto2 shell")
+            self.session = GPhotoSession(self._wsl_prefix(), self.camera_port, save_dir)
+
+    def prepare(self):
+        """Open the gphoto2 shell (if it was dropped) and round-trip to the camera, so
+        shell start-up and the PTP open happen now rather than at the shutter."""
+        self.start_session()
+        if not self.session.ping(timeout=8):
+            self._close_session()
+            self.start_session()
+
+    def _session_capture(self, save_path: str) -> int:
+        """Capture through the persistent gphoto2 shell, (re)starting it as needed.
+        Returns the saved file size, or 0 on failure.
+        """
+        self.start_session()
+        start = time.monotonic()
+        saved = self.session.capture()
+        size = _publish_capture(saved, save_path, 1000) if saved else 0
+        if size:
+            write_log(f"capture: SUCCESS (gphoto2 shell) in {time.monotonic() - start:.1f}s")
+            return size
+        # Drop the session; the one-shot path below gets a clean camera
+        self._close_session()
+        return 0
+
+    def capture(self, save_path: str) -> CaptureResult:
+        start = time.monotonic()
         try:
             if not self.connected:
                 write_log("capture: camera not connected")
-                return False
+                return CaptureResult(False, save_path)
+
+            size = self._session_capture(save_path)
+            if not size:
+                write_log("capture: gphoto2 shell failed, falling back to one-shot capture")
+                size = self._capture_oneshot(save_path)
+            return CaptureResult(size > 0, save_path, size, time.monotonic() - start)
+        except Exception as e:
+            write_log(f"capture: EXCEPTION - {e}")
+            self._close_session()
+            return CaptureResult(False, save_path, 0, time.monotonic() - start)
 
-            capture_start = time.time()
-            write_log(f"capture: starting capture to {save_path}")
+    def _capture_oneshot(self, save_path: str) -> int:
+        """Run a separate gphoto2 process for a single capture; returns the file size or 0."""
+        try:
+            capture_start = time.monotonic()
+            # Download into the staging folder; only a validated file reaches the gallery
+            staged = _staging_path(save_path)
+            write_log(f"capture: starting capture to {staged}")
             
             # Skip autofocus - let camera use its current focus setting (MF or AF)
             # This avoids 3-4 second timeout when camera is in manual focus mode
 
-            wsl_path = windows_path_to_wsl(save_path)
-            write_log(f"capture: WSL path = {wsl_path}")
-            
-            # Build gphoto2 command with explicit port if available (fixes multi-interface cameras)
-            port_arg = f"--port '{self.camera_port}'" if self.camera_port else ""
-            gphoto_cmd = f"{GPHOTO_CMD} {port_arg} --capture-image-and-download --filename '{wsl_path}' 2>&1"
-            write_log(f"capture: running {gphoto_cmd}")
-            
-            # Start gphoto2 in background and poll for file
-            full_cmd = self._wsl_prefix() + ["bash", "-lc", gphoto_cmd]
-            proc = subprocess.Popen(full_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            wsl_path = windows_path_to_wsl(staged)
+            if DEBUG_CAPTURE:
+                write_log(f"capture: WSL path = {wsl_path}")
             
-            # Poll for file existence (up to 30 seconds)
-            start_time = time.time()
-            last_size = 0
-            stable_count = 0
-            file_first_seen = None
+            # Start gphoto2 in background (exec'd directly, no shell) and poll for file
+            full_cmd = self._capture_cmd + [wsl_path]
+            write_log(f"capture: running {' '.join(full_cmd)}")
+            proc = subprocess.Popen(full_cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                    creationflags=NO_WINDOW)
             
-            while time.time() - start_time < 30:
-                if os.path.exists(save_path):
-                    if file_first_seen is None:
-                        file_first_seen = time.time()
-                        write_log(f"capture: file appeared after {file_first_seen - capture_start:.1f}s")
-                    
-                    current_size = os.path.getsize(save_path)
-                    write_log(f"capture: file detected, size = {current_size} bytes")
-                    
-                    # Wait for file to be completely written (size stable for 0.5s)
-                    if current_size > 100000 and current_size == last_size:
-                        stable_count += 1
-                        if stable_count >= 2:  # Stable for ~0.5 seconds
-                            total_time = time.time() - capture_start
-                            write_log(f"capture: file complete, size = {current_size} bytes, total time = {total_time:.1f}s")
-                            # Kill gphoto2 process if still running
-                            if proc.poll() is None:
-                                proc.terminate()
-                                try:
-                                    proc.wait(timeout=2)
-                                except:
-                                    proc.kill()
-                            write_log("capture: SUCCESS (fast path)")
-                            return True
-                    else:
-                        stable_count = 0
-                    last_size = current_size
-                
-                time.sleep(0.25)
+            # gphoto2 prints "Saving file as ..." and then, once the download is written,
+            # its next line (camera-side delete) or exits. Block on its output instead of
+            # polling the file every 250ms for a stable size (up to 30 seconds).
+            lines: "queue.Queue[Optional[bytes]]" = queue.Queue()
+
+            def pump():
+                for raw in iter(proc.stdout.readline, b""):
+                    lines.put(raw)
+                lines.put(None)
+
+            threading.Thread(target=pump, daemon=True).start()
+            deadline = time.monotonic() + 30
+            saving_seen = False
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    raw = lines.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if raw is not None and not saving_seen:
+                    line = raw.decode("utf-8", "replace").strip()
+                    if line.startswith("Saving file as"):
+                        saving_seen = True
+                        write_log(f"capture: {line} after {time.monotonic() - capture_start:.1f}s")
+                    elif line and DEBUG_CAPTURE:
+                        write_log(f"capture: gphoto2: {line}")
+                    continue
+                size = _file_size(staged) if saving_seen else 0
+                if size > 100000:
+                    total_time = time.monotonic() - capture_start
+                    write_log(f"capture: file complete, size = {size} bytes, total time = {total_time:.1f}s")
+                    # Kill gphoto2 process if still running
+                    if proc.poll() is None:
+                        proc.terminate()
+                        try:
+                            proc.wait(timeout=2)
+                        except:
+                            proc.kill()
+                    size = _publish_capture(staged, save_path, 100000)
+                    if size:
+                        write_log("capture: SUCCESS (fast path)")
+                        return size
+                if raw is None:
+                    break
             
             # If we get here, file wasn't detected in time - wait for process
             write_log("capture: fast path failed, waiting for gphoto2 to finish...")
             try:
-                stdout, stderr = proc.communicate(timeout=30)
+                proc.wait(timeout=30)
                 write_log(f"capture: gphoto2 finished, rc={proc.returncode}")
             except subprocess.TimeoutExpired:
                 proc.kill()
                 write_log("capture: gphoto2 killed after timeout")
             
             # Final check
-            if os.path.exists(save_path):
-                file_size = os.path.getsize(save_path)
-                if file_size > 1000:
-                    write_log(f"capture: SUCCESS (slow path), size = {file_size} bytes")
-                    return True
+            file_size = _publish_capture(staged, save_path, 1000)
+            if file_size:
+                write_log(f"capture: SUCCESS (slow path), size = {file_size} bytes")
+                return file_size
             
             write_log("capture: FAILED - file not created")
-            return False
+            return 0
             
         except Exception as e:
             write_log(f"capture: EXCEPTION - {e}")
-            return False
+            return 0
 
     def get_name(self) -> str:
         return self.camera_name
@@ -886,50 +1571,92 @@ class WSLGPhotoCamera(CameraInterface):
 class WIACamera(CameraInterface):
     """Windows Image Acquisition fallback"""
 
+    # WIA's "Take Picture" command
+    TAKE_PICTURE_ID = "{AF933CAC-ACAD-11D2-A093-00C04F72DC3C}"
+
     def __init__(self):
-        self.device = None
+        # Only the WIA DeviceID is kept: a connected device object belongs to the COM
+        # apartment of the thread that created it, and probes run on throwaway workers
+        self.device_id: Optional[str] = None
         self.device_name = "WIA Camera"
+        self._capture_cmd_id: Optional[str] = None  # Found on the first shot, reused after
 
     def connect(self) -> bool:
+        """Check that a WIA camera exists; each capture connects to it on its own thread."""
         try:
+            import pythoncom
             import win32com.client
-            device_manager = win32com.client.Dispatch("WIA.DeviceManager")
-            for device_info in device_manager.DeviceInfos:
-                if device_info.Type == 2:
-                    try:
-                        self.device = device_info.Connect()
-                        self.device_name = device_info.Properties("Name").Value
-                        return True
-                    except Exception:
-                        continue
+        except Exception:
             return False
+        pythoncom.CoInitialize()  # may run on a worker thread (detect_cameras, camera setup)
+        try:
+            return self._find_camera(win32com.client.Dispatch("WIA.DeviceManager"))
         except Exception:
             return False
+        finally:
+            pythoncom.CoUninitialize()
+
+    def _find_camera(self, device_manager) -> bool:
+        # COM references stay local, so they are released before CoUninitialize
+        for device_info in device_manager.DeviceInfos:
+            if device_info.Type == 2:
+                try:
+                    self.device_id = device_info.DeviceID
+                    self.device_name = device_info.Properties("Name").Value
+                    return True
+                except Exception:
+                    continue
+        return False
 
     def disconnect(self):
-        self.device = None
+        self.device_id = None
+        self._capture_cmd_id = None
 
     def is_connected(self) -> bool:
-        return self.device is not None
+        return self.device_id is not None
 
-    def capture(self, save_path: str) -> bool:
+    def capture(self, save_path: str) -> CaptureResult:
+        start = time.monotonic()
+        if not self.device_id:
+            return CaptureResult(False, save_path)
         try:
-            if not self.device:
-                return False
+            import pythoncom
             import win32com.client
-            for cmd in self.device.Commands:
-                if "capture" in cmd.Name.lower() or cmd.CommandID == "{AF933CAC-ACAD-11D2-A093-00C04F72DC3C}":
-                    self.device.ExecuteCommand(cmd.CommandID)
-                    break
-            items = self.device.Items
-            if items.Count > 0:
-                item = items[items.Count]
-                image = item.Transfer()
-                image.SaveFile(save_path)
-                return True
-            return False
         except Exception:
-            return False
+            return CaptureResult(False, save_path)
+        pythoncom.CoInitialize()  # captures run on a background thread
+        try:
+            size = self._capture_in_apartment(win32com.client.Dispatch("WIA.DeviceManager"), save_path)
+            return CaptureResult(size > 0, save_path, size, time.monotonic() - start)
+        except Exception:
+            return CaptureResult(False, save_path)
+        finally:
+            pythoncom.CoUninitialize()
+
+    def _capture_in_apartment(self, device_manager, save_path: str) -> int:
+        """Connect on the calling thread's apartment, shoot and save; returns the size or 0."""
+        device = None
+        for device_info in device_manager.DeviceInfos:
+            if device_info.DeviceID == self.device_id:
+                device = device_info.Connect()
+                break
+        if device is None:
+            return 0
+        if self._capture_cmd_id is None:
+            # Each Commands item is a COM round-trip: walk them once per camera
+            for cmd in device.Commands:
+                if "capture" in cmd.Name.lower() or cmd.CommandID == self.TAKE_PICTURE_ID:
+                    self._capture_cmd_id = cmd.CommandID
+                    break
+        if self._capture_cmd_id is not None:
+            device.ExecuteCommand(self._capture_cmd_id)
+        items = device.Items
+        if items.Count == 0:
+            return 0
+        image = items[items.Count].Transfer()
+        staged = _staging_path(save_path)
+        image.SaveFile(staged)
+        return _publish_capture(staged, save_path, 1000)
 
     def get_name(self) -> str:
         return self.device_name
@@ -940,39 +1667,44 @@ class CameraManager:
 
     def __init__(self):
         self.camera: Optional[CameraInterface] = None
+        self._capture_lock = threading.Lock()
+        self._last_capture: Optional[Future] = None
 
     def detect_cameras(self) -> list:
-        methods = []
-        try:
-            cam = WSLGPhotoCamera()
-            if cam.connect():
-                methods.append(("wsl-gphoto2", cam.get_name()))
-                cam.disconnect()
-        except Exception:
-            pass
-        try:
-            cam = WIACamera()
-            if cam.connect():
-                methods.append(("wia", cam.get_name()))
-                cam.disconnect()
-        except Exception:
-            pass
-        return methods
+        """Return [(key, name, camera)] for each backend that connects.
+        Cameras are left connected so the caller can adopt one without connecting again.
+        """
+        def probe(cls):
+            try:
+                cam = cls()
+                return cam if cam.connect() else None
+            except Exception:
+                return None
+
+        # The gphoto2 auto-detect and the WIA COM enumeration are independent,
+        # so run them side by side; results keep backend priority order
+        backends = (("wsl-gphoto2", WSLGPhotoCamera), ("wia", WIACamera))
+        with ThreadPoolExecutor(max_workers=len(backends)) as pool:
+            futures = [(key, pool.submit(probe, cls)) for key, cls in backends]
+        return [(key, f.result().get_name(), f.result()) for key, f in futures if f.result()]
 
     def connect_best(self) -> bool:
+        # Release the previous camera first so its gphoto2 shell lets go of the device
+        self.disconnect()
         methods = self.detect_cameras()
-        for key, name in methods:
-            if key == "wsl-gphoto2":
-                cam = WSLGPhotoCamera()
-                if cam.connect():
-                    self.camera = cam
-                    return True
-            elif key == "wia":
-                cam = WIACamera()
-                if cam.connect():
-                    self.camera = cam
-                    return True
-        return False
+        if not methods:
+            return False
+        key, name, cam = methods[0]
+        for _, _, other in methods[1:]:
+            try:
+                other.disconnect()
+            except Exception:
+                pass
+        if key == "wsl-gphoto2":
+            # Warm the gphoto2 shell now so the first shot doesn't pay its start-up
+            cam.start_session()
+        self.camera = cam
+        return True
 
     def disconnect(self):
         if self.camera:
@@ -988,73 +1720,205 @@ class CameraManager:
     def get_name(self) -> str:
         return self.camera.get_name() if self.camera else "No Camera"
 
-    def capture(self, save_path: str) -> bool:
-        return self.camera.capture(save_path) if self.camera else False
+    def capture_async(self, save_path: str) -> Future:
+        """Queue a capture and return a Future for its result.
+        Shots run in submission order, so the caller can trigger the next one
+        while the previous image is still downloading.
+        """
+        with self._capture_lock:
+            prior = self._last_capture
+
+            def job():
+                if prior is not None:
+                    concurrent.futures.wait([prior])
+                camera = self.camera
+                return camera.capture(save_path) if camera else CaptureResult(False, save_path)
+
+            self._last_capture = run_in_background(job)
+            return self._last_capture
+
+    def capture(self, save_path: str) -> CaptureResult:
+        return self.capture_async(save_path).result()
+
+    def prepare_async(self) -> Future:
+        """Warm the camera in the background, e.g. while a countdown runs. It is queued
+        like a shot, so a capture requested meanwhile waits for it to finish."""
+        with self._capture_lock:
+            prior = self._last_capture
+
+            def job():
+                if prior is not None:
+                    concurrent.futures.wait([prior])
+                camera = self.camera
+                if camera:
+                    camera.prepare()
+
+            self._last_capture = run_in_background(job)
+            return self._last_capture
 
 
 # ============================================================================
 # SNOWFLAKE ANIMATION
 # ============================================================================
 
-class Snowflake:
-    """Festive particle - snow or golden sparkle"""
+class SnowflakeField:
+    """Festive particles - snow or golden sparkle.
+    Flakes share their (speed, drift) with the rest of their group, so a frame is one
+    canvas.move per group tag rather than one Tk call per flake.
+    Motion is linear between wraps, so each flake only stores where it last wrapped and
+    the frame it will next leave the screen; a frame touches just the flakes due then.
+    """
     COLORS = ["white", "white", "white", "#FFD700", "#FFD700", "#FF6B9D", "#B388FF"]  # Mix of snow and sparkles
-    
-    def __init__(self, canvas: Canvas, width: int, height: int):
+    GROUPS = 12  # Distinct motions; plenty to look random at SNOW_COUNT flakes
+
+    def __init__(self, canvas: Canvas, width: int, height: int, count: int = SNOW_COUNT):
         self.canvas = canvas
         self.width = width
         self.height = height
-        self.reset()
-
-    def reset(self):
-        self.x = random.randint(0, self.width)
-        self.y = random.randint(-self.height, 0)
-        self.size = random.randint(2, 8)
-        self.speed = random.uniform(*SNOW_SPEED)
-        self.drift = random.uniform(-0.8, 0.8)
-        self.color = random.choice(self.COLORS)
+        randint, uniform = random.randint, random.uniform
+        self.colors = random.choices(self.COLORS, k=count)
         # Golden particles are slightly larger
-        if self.color != "white":
-            self.size = random.randint(3, 6)
-        self.id = self.canvas.create_oval(
-            self.x, self.y, self.x + self.size, self.y + self.size,
-            fill=self.color, outline="", tags="snow"
-        )
-
-    def update(self):
-        self.y += self.speed
-        self.x += self.drift
-        if self.y > self.height:
-            self.y = -10
-            self.x = random.randint(0, self.width)
-        if self.x < 0 or self.x > self.width:
-            self.x = random.randint(0, self.width)
-        self.canvas.coords(self.id, self.x, self.y, self.x + self.size, self.y + self.size)
+        self.size = [randint(2, 8) if c == "white" else randint(3, 6) for c in self.colors]
+        self.x = [float(randint(0, width)) for _ in range(count)]   # Position at frame t0
+        self.y = [float(randint(-height, 0)) for _ in range(count)]
+        self.t0 = [0] * count
+        self.group_motion = [(uniform(*SNOW_SPEED), uniform(-0.8, 0.8)) for _ in range(self.GROUPS)]
+        self.group_tags = [f"snow_g{g}" for g in range(self.GROUPS)]
+        group = [g % self.GROUPS for g in range(count)]
+        random.shuffle(group)
+        self.speed = [self.group_motion[g][0] for g in group]
+        self.drift = [self.group_motion[g][1] for g in group]
+        self.ids = [
+            canvas.create_oval(x, y, x + sz, y + sz, fill=c, outline="", tags=("snow", self.group_tags[g]))
+            for x, y, sz, c, g in zip(self.x, self.y, self.size, self.colors, group)
+        ]
+        self.frame = 0
+        self._due: dict = {}  # frame -> flakes that leave the screen on that frame
+        for i in range(count):
+            self._schedule(i)
+
+    def _schedule(self, i: int):
+        """File flake i under the first frame after t0 where it is off screen."""
+        x, y, speed, drift = self.x[i], self.y[i], self.speed[i], self.drift[i]
+        steps = int((self.height - y) / speed) + 1
+        if drift > 0:
+            steps = min(steps, int((self.width - x) / drift) + 1)
+        elif drift < 0:
+            steps = min(steps, int(x / -drift) + 1)
+        self._due.setdefault(self.t0[i] + steps, []).append(i)
+
+    def update_all(self):
+        self.frame = frame = self.frame + 1
+        move = self.canvas.move
+        # Sizes never change, so a relative move of each group's tag moves every flake
+        for tag, (speed, drift) in zip(self.group_tags, self.group_motion):
+            move(tag, drift, speed)
+        due = self._due.pop(frame, None)
+        if not due:
+            return
+        width, height = self.width, self.height
+        coords, randint = self.canvas.coords, random.randint
+        for i in due:
+            elapsed = frame - self.t0[i]
+            y = self.y[i] + self.speed[i] * elapsed
+            # Wrapped: teleport with a full coords update (overrides this frame's move)
+            if y > height:
+                y = -10
+            x = randint(0, width)
+            sz = self.size[i]
+            coords(self.ids[i], x, y, x + sz, y + sz)
+            self.x[i], self.y[i], self.t0[i] = float(x), y, frame
+            self._schedule(i)
 
 # ============================================================================
 # THEMED DIALOG (Canvas overlay - stays in fullscreen)
 # ============================================================================
 
+@dataclass(frozen=True)
+class _DialogLayout:
+    """Absolute canvas positions for one dialog kind on one canvas size."""
+    dw: int
+    dh: int
+    dx: int
+    dy: int
+    cx: int                 # horizontal centre of the dialog
+    icon_y: int
+    title_y: int
+    message_y: int
+    buttons: tuple          # (x, y) centre of each button, left to right
+
+
+# Per dialog kind: box size, y offsets of icon/title/message, button centres relative
+# to the box's top centre
+_DIALOG_SPECS = {
+    "yes_no": ((600, 340), 65, 135, 190, ((-100, 275), (100, 275))),
+    "message": ((450, 220), 50, 100, 140, ((0, 185),)),
+}
+
+
+@lru_cache(maxsize=4)
+def _dialog_layout(kind: str, cw: int, ch: int) -> _DialogLayout:
+    (dw, dh), icon, title, message, buttons = _DIALOG_SPECS[kind]
+    dx = (cw - dw) // 2
+    dy = (ch - dh) // 2
+    cx = dx + dw // 2
+    return _DialogLayout(dw, dh, dx, dy, cx, dy + icon, dy + title, dy + message,
+                         tuple((cx + bx, dy + by) for bx, by in buttons))
+
+
 class ThemedDialog:
     """Custom dialog overlaid on the main canvas - no fullscreen exit needed"""
     
+    # Rendered dialog frames (gold border, background, button plates) keyed by layout
+    _chrome_cache: dict = {}
+    # Main booth canvas, registered once via bind_canvas() so dialogs needn't search for it
+    _default_canvas: Optional[Canvas] = None
+
+    @staticmethod
+    def bind_canvas(canvas: Canvas):
+        ThemedDialog._default_canvas = canvas
+
+    @staticmethod
+    def _chrome(key: str, dw: int, dh: int, buttons: tuple):
+        """Frame + button plates as one PhotoImage, drawn once per layout.
+        buttons holds (cx, cy, half_w, half_h, fill) relative to the dialog box.
+        """
+        img = ThemedDialog._chrome_cache.get(key)
+        if img is None:
+            from PIL import ImageDraw
+            _load_pil()
+            im = Image.new("RGB", (dw + 8, dh + 8), THEME_ACCENT)
+            draw = ImageDraw.Draw(im)
+            draw.rectangle((4, 4, dw + 3, dh + 3), fill=THEME_BG)
+            for cx, cy, hw, hh, fill in buttons:
+                draw.rectangle((cx - hw + 4, cy - hh + 4, cx + hw + 4, cy + hh + 4),
+                               fill=fill, outline="white", width=2)
+            img = ImageTk.PhotoImage(im)
+            ThemedDialog._chrome_cache[key] = img
+        return img
+
+    @staticmethod
+    def _find_canvas(parent) -> Optional[Canvas]:
+        canvas = ThemedDialog._default_canvas
+        if canvas is not None and canvas.master is parent:
+            return canvas
+        # Last resort: scan the parent's children (builds a fresh list from Tcl)
+        return next((c for c in parent.winfo_children() if isinstance(c, Canvas)), None)
+
     @staticmethod
     def ask_yes_no(parent, title: str, message: str, icon: str = "⚠️", canvas=None) -> bool:
         """Show a themed yes/no dialog as canvas overlay. Returns True if yes."""
         
         # Try to find the canvas if not provided
         if canvas is None:
-            for child in parent.winfo_children():
-                if isinstance(child, Canvas):
-                    canvas = child
-                    break
+            canvas = ThemedDialog._find_canvas(parent)
         
         if canvas is None:
             # Fallback to simple dialog if no canvas found
             from tkinter import messagebox
             return messagebox.askyesno(title, message)
         
-        result = [None]  # Store result
+        answer = tk.BooleanVar(master=parent)  # Written once by YES/NO
         
         # Get canvas dimensions
         cw = canvas.winfo_width()
@@ -1067,26 +1931,24 @@ class ThemedDialog:
             tags="dialog_overlay"
         )
         
-        # Dialog box dimensions (larger for better readability)
-        dw, dh = 600, 340
-        dx = (cw - dw) // 2
-        dy = (ch - dh) // 2
-        
-        # Dialog background (dark with gold border effect)
-        canvas.create_rectangle(
-            dx-4, dy-4, dx+dw+4, dy+dh+4,
-            fill=THEME_ACCENT, outline="",
-            tags="dialog_overlay"
-        )
-        canvas.create_rectangle(
-            dx, dy, dx+dw, dy+dh,
-            fill=THEME_BG, outline="",
+        # Dialog box (larger for better readability); positions are cached per canvas size
+        lay = _dialog_layout("yes_no", cw, ch)
+        (yes_x, yes_y), (no_x, no_y) = lay.buttons
+        
+        # Dialog background (dark with gold border effect) and YES/NO button plates,
+        # pre-rendered as a single image
+        chrome = canvas.create_image(
+            lay.dx-4, lay.dy-4, anchor="nw",
+            image=ThemedDialog._chrome("yes_no", lay.dw, lay.dh, (
+                (yes_x - lay.dx, yes_y - lay.dy, 65, 28, THEME_SUCCESS),
+                (no_x - lay.dx, no_y - lay.dy, 65, 28, THEME_DANGER),
+            )),
             tags="dialog_overlay"
         )
         
         # Icon
         canvas.create_text(
-            dx + dw//2, dy + 65,
+            lay.cx, lay.icon_y,
             text=icon, font=("Segoe UI Emoji", 52),
             fill=THEME_ACCENT,
             anchor="center", justify="center",
@@ -1095,7 +1957,7 @@ class ThemedDialog:
         
         # Title
         canvas.create_text(
-            dx + dw//2, dy + 135,
+            lay.cx, lay.title_y,
             text=title, font=("Segoe UI", 28, "bold"),
             fill=THEME_TEXT,
             tags="dialog_overlay"
@@ -1103,19 +1965,13 @@ class ThemedDialog:
         
         # Message
         canvas.create_text(
-            dx + dw//2, dy + 190,
+            lay.cx, lay.message_y,
             text=message, font=("Segoe UI", 20),
             fill="#CCCCCC", width=550,
             tags="dialog_overlay"
         )
         
         # YES button
-        yes_x, yes_y = dx + dw//2 - 100, dy + 275
-        yes_btn = canvas.create_rectangle(
-            yes_x-65, yes_y-28, yes_x+65, yes_y+28,
-            fill=THEME_SUCCESS, outline="white", width=2,
-            tags="dialog_overlay"
-        )
         yes_txt = canvas.create_text(
             yes_x, yes_y, text="✓  YES",
             font=("Segoe UI", 20, "bold"), fill="white",
@@ -1123,12 +1979,6 @@ class ThemedDialog:
         )
         
         # NO button
-        no_x, no_y = dx + dw//2 + 100, dy + 275
-        no_btn = canvas.create_rectangle(
-            no_x-65, no_y-28, no_x+65, no_y+28,
-            fill=THEME_DANGER, outline="white", width=2,
-            tags="dialog_overlay"
-        )
         no_txt = canvas.create_text(
             no_x, no_y, text="✗  NO",
             font=("Segoe UI", 20, "bold"), fill="white",
@@ -1136,38 +1986,42 @@ class ThemedDialog:
         )
         
         def on_yes(event=None):
-            result[0] = True
             canvas.delete("dialog_overlay")
+            answer.set(True)
         
         def on_no(event=None):
-            result[0] = False
             canvas.delete("dialog_overlay")
+            answer.set(False)
+        
+        def on_chrome(event):
+            # The button plates are part of the chrome image, so hit-test them here
+            x, y = canvas.canvasx(event.x), canvas.canvasy(event.y)
+            if abs(y - yes_y) <= 28:
+                if abs(x - yes_x) <= 65:
+                    on_yes()
+                elif abs(x - no_x) <= 65:
+                    on_no()
         
         # Bind click events
-        canvas.tag_bind(yes_btn, "<Button-1>", on_yes)
+        canvas.tag_bind(chrome, "<Button-1>", on_chrome)
         canvas.tag_bind(yes_txt, "<Button-1>", on_yes)
-        canvas.tag_bind(no_btn, "<Button-1>", on_no)
         canvas.tag_bind(no_txt, "<Button-1>", on_no)
         
         # Raise dialog to top
         canvas.tag_raise("dialog_overlay")
         
-        # Wait for user response
-        while result[0] is None:
-            parent.update()
-            parent.after(50)
+        # Wait for user response; wait_variable keeps Tk's event loop running
+        # without spinning on update()
+        parent.wait_variable(answer)
         
-        return result[0]
+        return answer.get()
     
     @staticmethod  
     def show_message(parent, title: str, message: str, icon: str = "✓", canvas=None):
         """Show a themed message dialog as canvas overlay."""
         
         if canvas is None:
-            for child in parent.winfo_children():
-                if isinstance(child, Canvas):
-                    canvas = child
-                    break
+            canvas = ThemedDialog._find_canvas(parent)
         
         if canvas is None:
             from tkinter import messagebox
@@ -1184,25 +2038,21 @@ class ThemedDialog:
             tags="dialog_overlay"
         )
         
-        # Dialog box
-        dw, dh = 450, 220
-        dx = (cw - dw) // 2
-        dy = (ch - dh) // 2
+        # Dialog box (frame and OK plate pre-rendered as one image)
+        lay = _dialog_layout("message", cw, ch)
+        (ok_x, ok_y), = lay.buttons
         
-        canvas.create_rectangle(
-            dx-4, dy-4, dx+dw+4, dy+dh+4,
-            fill=THEME_ACCENT, outline="",
-            tags="dialog_overlay"
-        )
-        canvas.create_rectangle(
-            dx, dy, dx+dw, dy+dh,
-            fill=THEME_BG, outline="",
+        chrome = canvas.create_image(
+            lay.dx-4, lay.dy-4, anchor="nw",
+            image=ThemedDialog._chrome("message", lay.dw, lay.dh, (
+                (ok_x - lay.dx, ok_y - lay.dy, 50, 18, THEME_ACCENT),
+            )),
             tags="dialog_overlay"
         )
         
         # Icon
         canvas.create_text(
-            dx + dw//2, dy + 50,
+            lay.cx, lay.icon_y,
             text=icon, font=("Segoe UI Emoji", 40),
             fill=THEME_SUCCESS,
             tags="dialog_overlay"
@@ -1210,7 +2060,7 @@ class ThemedDialog:
         
         # Title
         canvas.create_text(
-            dx + dw//2, dy + 100,
+            lay.cx, lay.title_y,
             text=title, font=("Segoe UI", 20, "bold"),
             fill=THEME_TEXT,
             tags="dialog_overlay"
@@ -1218,38 +2068,35 @@ class ThemedDialog:
         
         # Message
         canvas.create_text(
-            dx + dw//2, dy + 140,
+            lay.cx, lay.message_y,
             text=message, font=("Segoe UI", 14),
             fill="#CCCCCC", width=400,
             tags="dialog_overlay"
         )
         
         # OK button
-        ok_x, ok_y = dx + dw//2, dy + 185
-        ok_btn = canvas.create_rectangle(
-            ok_x-50, ok_y-18, ok_x+50, ok_y+18,
-            fill=THEME_ACCENT, outline="white", width=2,
-            tags="dialog_overlay"
-        )
         ok_txt = canvas.create_text(
             ok_x, ok_y, text="OK",
             font=("Segoe UI", 14, "bold"), fill="black",
             tags="dialog_overlay"
         )
         
-        done = [False]
+        done = tk.BooleanVar(master=parent)
         
         def on_ok(event=None):
-            done[0] = True
             canvas.delete("dialog_overlay")
+            done.set(True)
+        
+        def on_chrome(event):
+            x, y = canvas.canvasx(event.x), canvas.canvasy(event.y)
+            if abs(x - ok_x) <= 50 and abs(y - ok_y) <= 18:
+                on_ok()
         
-        canvas.tag_bind(ok_btn, "<Button-1>", on_ok)
+        canvas.tag_bind(chrome, "<Button-1>", on_chrome)
         canvas.tag_bind(ok_txt, "<Button-1>", on_ok)
         canvas.tag_raise("dialog_overlay")
         
-        while not done[0]:
-            parent.update()
-            parent.after(50)
+        parent.wait_variable(done)
 
 # ============================================================================
 # PHOTO ZOOM & GALLERY VIEWER (Lightweight)
@@ -1258,18 +2105,39 @@ class ThemedDialog:
 class PhotoZoomViewer:
     """Simple, lightweight photo viewer with basic zoom/pan"""
 
+    HI_CACHE_ZOOM = 1.5  # Above this zoom, render from the 2x cache for detail
+    PRELOAD_CACHE_SIZE = 5  # Decoded + pre-scaled photos kept for instant ◀/▶
+    RENDER_CACHE_SIZE = 4   # Finished PhotoImages of the current photo, by size
+    # Pixel budget for those frames (~48 MB as Tk images): four 2x-fit frames at 1080p,
+    # while a single 6x frame (~25 MP) is never cached at all
+    RENDER_CACHE_PIXELS = 12_000_000
+
     def __init__(self, canvas: Canvas, ui_photo_id, width: int, height: int):
         self.canvas = canvas
         self.ui_photo_id = ui_photo_id
         self.width = width
         self.height = height
 
+        # Fixed geometry, so the per-event paths don't redo the arithmetic
+        self._cx0 = width // 2
+        self._cy0 = height // 2
+        self._visible_w = width * 0.75   # Account for side buttons
+        self._visible_h = height * 0.70  # Account for header/footer
+
         # Photo management
         self.photos = []
+        self._scan_cache: Optional[tuple] = None  # (dir, dir mtime_ns, photos) of the last scan
         self.current_idx = 0
-        self.original_image = None
         self.photo_display = None
-        self.cached_image = None  # Pre-scaled for display
+        self.cached_image = None  # Pre-scaled to the base display size (zoom <= HI_CACHE_ZOOM)
+        self.cached_hi = None     # 2x copy for deeper zoom (the on-disk thumbnail)
+
+        # Neighbour preloading: (path, mtime) -> (cached_image, cached_hi, base_w, base_h).
+        # The mtime keeps a file rewritten under the same name from showing its old pixels.
+        self._preload_pool = ThreadPoolExecutor(max_workers=3)
+        self._preloaded: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._preloading: dict = {}  # (path, mtime) -> Future still running
+        self._preload_lock = threading.Lock()
 
         # Zoom/Pan state
         self.zoom_level = 1.0
@@ -1278,16 +2146,31 @@ class PhotoZoomViewer:
         self.min_zoom = 0.5
         self.max_zoom = 6.0  # Allow more zoom for detail
         
-        # Base display dimensions
+        # Base display dimensions, and the zoomed size (kept current by _set_zoom)
         self.base_display_w = 0
         self.base_display_h = 0
+        self._display_w = 1
+        self._display_h = 1
+        self._max_pan_x = 0.0  # Pan limits for the current zoom, see _clamp_pan
+        self._max_pan_y = 0.0
         
         # Drag state
         self.drag_start = None
+        self._render_pending = False  # A coalesced redraw is queued for the next idle
+        self._pixels_dirty = False    # ...and it needs a resample, not just a move
+        self._interactive = False     # Wheel zoom in progress: render fast, refine afterwards
+        self._rendered = None         # (source, w, h, resample) currently in photo_display
+        self._render_cache: "OrderedDict[tuple, tuple]" = OrderedDict()  # key -> (source, PhotoImage)
+        self._source_array = None     # (source, ndarray) when OpenCV does the resizing
+        self._settle_job = None
+        self._wheel_steps = 0         # Net wheel ticks (+ in, - out) not yet applied
+        self._wheel_pos = (0, 0)
+        self._wheel_job = None
 
         # UI elements
         self.zoom_text_id = None
         self.photo_counter_id = None
+        self._buttons_built = False  # Control buttons exist on the canvas (maybe hidden)
 
         # Bind mouse events
         self.canvas.bind("<MouseWheel>", self._on_mousewheel)
@@ -1296,21 +2179,88 @@ class PhotoZoomViewer:
         self.canvas.bind("<ButtonRelease-1>", self._on_mouse_release)
         self.canvas.bind("<Double-Button-1>", self._on_double_click)
 
+    def _scan_photos(self, photo_dir: str) -> list:
+        """Photo paths in photo_dir, oldest first (safe off the Tk thread)."""
+        try:
+            dir_mtime = os.stat(photo_dir).st_mtime_ns
+        except OSError:
+            return []
+        # Adding, deleting or renaming a file bumps the folder's mtime: if it hasn't
+        # moved since the last scan, the listing can't have changed either
+        cached = self._scan_cache
+        if cached and cached[:2] == (photo_dir, dir_mtime):
+            return list(cached[2])
+        # scandir entries carry their own path and cache stat(), so sorting by
+        # mtime needs no extra path joins or per-file getmtime calls
+        with os.scandir(photo_dir) as it:
+            entries = [e for e in it
+                       if e.name.lower().endswith(('.jpg', '.jpeg', '.png')) and e.is_file()]
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        photos = [e.path for e in entries]
+        self._scan_cache = (photo_dir, dir_mtime, tuple(photos))
+        return photos
+
     def load_existing_photos(self, photo_dir: str):
         """Load existing photos from directory"""
         try:
-            if os.path.exists(photo_dir):
-                photos = sorted([
-                    os.path.join(photo_dir, f) 
-                    for f in os.listdir(photo_dir) 
-                    if f.lower().endswith(('.jpg', '.jpeg', '.png'))
-                ], key=os.path.getmtime)
-                self.photos = photos
-                if photos:
-                    write_log(f"Loaded {len(photos)} existing photos from gallery")
+            self.photos = self._scan_photos(photo_dir)
+            if self.photos:
+                write_log(f"Loaded {len(self.photos)} existing photos from gallery")
         except Exception as e:
             write_log(f"Error loading existing photos: {e}")
 
+    def load_existing_photos_async(self, photo_dir: str):
+        """Like load_existing_photos, but scan in the background (used at startup)."""
+        def scan():
+            started = time.time()
+            try:
+                photos = self._scan_photos(photo_dir)
+            except Exception as e:
+                write_log(f"Error loading existing photos: {e}")
+                return
+            self.canvas.after(0, self._photos_ready, photos)
+            self._prune_thumbs(photos, started)
+        run_in_background(scan)
+
+    def _prune_thumbs(self, photos: list, older_than: float):
+        """Delete display caches no current photo maps to (deleted or replaced photos,
+        old screen sizes). Files written since older_than are kept: they may belong to
+        a photo captured after the scan."""
+        keep = set()
+        for path in photos:
+            try:
+                keep.add(os.path.basename(self._thumb_path(path)))
+            except OSError:
+                pass  # Photo removed since the scan; its thumb goes too
+        removed = 0
+        try:
+            with os.scandir(THUMB_DIR) as it:
+                for entry in it:
+                    try:
+                        if (entry.name not in keep and entry.is_file()
+                                and entry.stat().st_mtime < older_than):
+                            os.remove(entry.path)
+                            removed += 1
+                    except OSError:
+                        pass
+        except OSError as e:
+            write_log(f"Thumbnail cleanup failed: {e}")
+            return
+        if removed:
+            write_log(f"Removed {removed} stale gallery thumbnails")
+
+    def _photos_ready(self, photos: list):
+        # A capture may have been added while the scan ran: keep it, and keep its index
+        current = self.photos[self.current_idx] if self.photos else None
+        known = set(photos)
+        self.photos = photos + [p for p in self.photos if p not in known]
+        if current is not None:
+            self.current_idx = self.photos.index(current)
+        if photos:
+            write_log(f"Loaded {len(photos)} existing photos from gallery")
+        if self.photo_counter_id:  # Only refresh it; the home screen has no counter
+            self._update_photo_counter()
+
     def add_photo(self, photo_path: str):
         """Add photo to gallery"""
         if photo_path not in self.photos:
@@ -1322,83 +2272,266 @@ class PhotoZoomViewer:
     def load_photo(self, photo_path: str):
         """Load and display a photo"""
         try:
-            with Image.open(photo_path) as img:
-                self.original_image = img.copy()
+            entry = self._get_scaled(photo_path)
+            if entry is None:
+                return
+            self.cached_image, self.cached_hi, self.base_display_w, self.base_display_h = entry
+            self._rendered = None  # The booth may have shown its own image on this item
+            self._render_cache.clear()
             
-            self.zoom_level = 1.0
+            self._set_zoom(1.0)
             self.pan_x = 0.0
             self.pan_y = 0.0
             
             self.add_photo(photo_path)
-            self._cache_image()
             self._render_photo()
             self._update_photo_counter()
+            self._preload_neighbors()
         except Exception as e:
             write_log(f"Error loading photo: {e}")
 
-    def _cache_image(self):
-        """Cache scaled version for display"""
-        if not self.original_image:
-            return
+    def _base_size(self, image) -> tuple:
+        """Fit-to-screen display size for an image."""
+        display_width = int(self.width * 0.80)
+        display_height = int(self.height * 0.65)
+        ratio = min(display_width / image.width, display_height / image.height)
+        return int(image.width * ratio), int(image.height * ratio)
+
+    def _thumb_path(self, path: str) -> str:
+        """On-disk 2x display cache for a photo; a new mtime or screen size gets a new file."""
+        key = f"{path}|{os.path.getmtime(path)}|{self.width}x{self.height}"
+        return os.path.join(THUMB_DIR, hashlib.sha1(key.encode()).hexdigest() + ".jpg")
+
+    @staticmethod
+    def _save_thumb(image, thumb_path: str):
         try:
-            display_width = int(self.width * 0.80)
-            display_height = int(self.height * 0.65)
-            ratio = min(display_width / self.original_image.width, display_height / self.original_image.height)
-            
-            self.base_display_w = int(self.original_image.width * ratio)
-            self.base_display_h = int(self.original_image.height * ratio)
-            
-            # Cache at 2x for zoom quality
-            cache_w = self.base_display_w * 2
-            cache_h = self.base_display_h * 2
-            self.cached_image = self.original_image.resize((cache_w, cache_h), Image.Resampling.LANCZOS)
+            tmp = f"{thumb_path}.{threading.get_ident()}.tmp"
+            image.convert("RGB").save(tmp, "JPEG", quality=85)
+            os.replace(tmp, thumb_path)  # Readers never see a half-written thumbnail
         except Exception as e:
-            write_log(f"Error caching image: {e}")
+            write_log(f"Thumbnail save failed: {e}")
+
+    @staticmethod
+    def _open_decoded(path: str, draft_size: Optional[tuple] = None):
+        """Open and fully decode an image. load() releases the file itself, so there is
+        no need for a context manager plus a full-frame copy() to escape it.
+
+        With draft_size, JPEGs are decoded at the smallest 1/2, 1/4 or 1/8 scale that
+        still covers it (libjpeg DCT scaling), which is far cheaper than a full decode."""
+        img = Image.open(path)
+        if draft_size and img.format == "JPEG":
+            img.draft("RGB", draft_size)
+        img.load()
+        return img
+
+    def _decode_and_scale(self, path: str) -> tuple:
+        """Build a photo's display caches (safe off the Tk thread).
+
+        The 2x copy is kept on disk, so after the first view a photo costs one small
+        JPEG decode instead of a full-resolution decode plus downscale."""
+        thumb_path = self._thumb_path(path)
+        if os.path.exists(thumb_path):
+            hi = self._open_decoded(thumb_path)
+            w, h = hi.width // 2, hi.height // 2
+        else:
+            # Only the 2x display copy is ever built from the original
+            original = self._open_decoded(
+                path, (int(self.width * 0.80 * 2), int(self.height * 0.65 * 2)))
+            w, h = self._base_size(original)
+            hi = self._downscale(original, w * 2, h * 2)
+            del original  # Don't hold the full-resolution frame while the thumb is written
+            self._preload_pool.submit(self._save_thumb, hi, thumb_path)
+        # Most viewing happens at or near fit-to-screen zoom: render from a 1x copy
+        return self._downscale(hi, w, h), hi, w, h
+
+    @staticmethod
+    def _downscale(image, w: int, h: int):
+        """Cheap high-quality shrink: BILINEAR to 1.25x the target, then BICUBIC.
+        Looks the same as LANCZOS here at a fraction of the cost."""
+        interim = (int(w * 1.25), int(h * 1.25))
+        if image.width > interim[0] and image.height > interim[1]:
+            image = image.resize(interim, Image.Resampling.BILINEAR)
+        return image.resize((w, h), Image.Resampling.BICUBIC)
+
+    @staticmethod
+    def _cache_key(path: str) -> tuple:
+        try:
+            return path, os.path.getmtime(path)
+        except OSError:
+            return path, None
+
+    def _preload(self, path: str, key: tuple):
+        try:
+            entry = self._decode_and_scale(path)
+        except Exception as e:
+            write_log(f"Preload failed for {os.path.basename(path)}: {e}")
+            entry = None
+        with self._preload_lock:
+            self._preloading.pop(key, None)
+            if entry is not None:
+                self._preloaded[key] = entry
+                self._preloaded.move_to_end(key)
+                while len(self._preloaded) > self.PRELOAD_CACHE_SIZE:
+                    self._preloaded.popitem(last=False)
+        return entry
+
+    def prefetch(self, path: str) -> Future:
+        """Start building path's display caches in the background (no-op if cached or
+        already running). load_photo(path) then only picks up the result."""
+        key = self._cache_key(path)
+        with self._preload_lock:
+            future = self._preloading.get(key)
+            if future is None:
+                if key in self._preloaded:
+                    future = Future()
+                    future.set_result(self._preloaded[key])
+                else:
+                    future = self._preloading[key] = self._preload_pool.submit(self._preload, path, key)
+        return future
+
+    def close(self):
+        """Stop preloading: queued decodes are dropped, running ones finish in the background."""
+        self._preload_pool.shutdown(wait=False, cancel_futures=True)
+
+    def forget(self, path: str):
+        """Drop path's decoded copies (e.g. once the file is deleted)."""
+        with self._preload_lock:
+            for key in [k for k in self._preloaded if k[0] == path]:
+                del self._preloaded[key]
+
+    def _preload_neighbors(self):
+        """Decode/scale the photos either side of the current one in the background."""
+        for idx in (self.current_idx + 1, self.current_idx - 1):
+            if 0 <= idx < len(self.photos):
+                self.prefetch(self.photos[idx])
+
+    def _get_scaled(self, path: str) -> tuple:
+        """Cached entry for path; waits for an in-flight preload, else decodes now."""
+        key = self._cache_key(path)
+        with self._preload_lock:
+            entry = self._preloaded.get(key)
+            pending = self._preloading.get(key)
+            if entry is not None:
+                self._preloaded.move_to_end(key)
+                return entry
+        if pending is not None:
+            entry = pending.result()
+        return entry or self._preload(path, key)
 
     def _render_photo(self):
         """Render photo at current zoom/pan"""
         if not self.cached_image:
             return
+        self._render_pixels()
+        self._render_position()
+        self._update_zoom_indicator()
+
+    def _render_pixels(self):
+        """Resample the cached image to the current zoom into photo_display."""
         try:
-            display_w = max(1, int(self.base_display_w * self.zoom_level))
-            display_h = max(1, int(self.base_display_h * self.zoom_level))
+            display_w, display_h = self._display_w, self._display_h
             
-            img_resized = self.cached_image.resize((display_w, display_h), Image.Resampling.BILINEAR)
-            self.photo_display = ImageTk.PhotoImage(img_resized)
-            self.canvas.itemconfig(self.ui_photo_id, image=self.photo_display)
-            
-            center_x = self.width // 2 + int(self.pan_x)
-            center_y = self.height // 2 + int(self.pan_y)
-            self.canvas.coords(self.ui_photo_id, center_x, center_y)
-            
-            self._update_zoom_indicator()
+            # NEAREST while the user is dragging/scrolling; BILINEAR once they stop
+            resample = Image.Resampling.NEAREST if self._interactive else Image.Resampling.BILINEAR
+            source = self.cached_image
+            if self.zoom_level > self.HI_CACHE_ZOOM and self.cached_hi:
+                source = self.cached_hi
+            rendered = self._rendered
+            key = (id(source), display_w, display_h, resample)
+            cache = self._render_cache
+            if rendered and rendered[0] is source and rendered[1:] == (display_w, display_h, resample):
+                pass  # Pure pan: pixels unchanged, only move the item below
+            elif key in cache:
+                # Seen this exact frame lately (e.g. double-click toggling 1x <-> 2x)
+                cache.move_to_end(key)
+                self.photo_display = cache[key][1]
+                self.canvas.itemconfig(self.ui_photo_id, image=self.photo_display)
+            elif (rendered and rendered[1:3] == (display_w, display_h)
+                  and not any(photo is self.photo_display for _, photo in cache.values())):
+                # Same size (refine after zoom, or next photo at equal size): update the
+                # existing Tk image in place instead of allocating a new one. Never
+                # paste into a cached frame, that would change what the cache holds.
+                self.photo_display.paste(self._resize(source, display_w, display_h, resample))
+            else:
+                img_resized = self._resize(source, display_w, display_h, resample)
+                self.photo_display = ImageTk.PhotoImage(img_resized)
+                self.canvas.itemconfig(self.ui_photo_id, image=self.photo_display)
+            # Keep final-quality frames only; interactive ones are throwaway
+            if (not self._interactive and key not in cache
+                    and display_w * display_h <= self.RENDER_CACHE_PIXELS):
+                # Holding source on purpose: the key uses id(source), which must not be
+                # reused by another image while the entry exists
+                cache[key] = (source, self.photo_display)
+                while (len(cache) > self.RENDER_CACHE_SIZE
+                       or sum(k[1] * k[2] for k in cache) > self.RENDER_CACHE_PIXELS):
+                    cache.popitem(last=False)
+            self._rendered = (source, display_w, display_h, resample)
         except Exception as e:
             write_log(f"Error rendering photo: {e}")
 
+    def _render_position(self):
+        """Place the photo item for the current pan: O(1), no pixels touched."""
+        self.canvas.coords(self.ui_photo_id, self._cx0 + int(self.pan_x), self._cy0 + int(self.pan_y))
+
+    def _resize(self, source, w: int, h: int, resample):
+        """Resize a cached image, via OpenCV when it's installed (PIL otherwise)."""
+        cv2 = _load_cv2()
+        if not cv2 or source.mode not in ("RGB", "RGBA", "L"):
+            return source.resize((w, h), resample)
+        # Keep the ndarray view of the current source so each frame skips the conversion
+        if self._source_array is None or self._source_array[0] is not source:
+            import numpy as np
+            self._source_array = (source, np.asarray(source))
+        interp = cv2.INTER_NEAREST if resample == Image.Resampling.NEAREST else cv2.INTER_LINEAR
+        out = cv2.resize(self._source_array[1], (w, h), interpolation=interp)
+        # Mode inferred from the array shape (fromarray's mode argument is deprecated)
+        img = Image.fromarray(out)
+        return img if img.mode == source.mode else img.convert(source.mode)
+
+    def _schedule_render(self, pixels: bool = True):
+        """Redraw once at the next idle point, however many input events arrive first.
+        pixels=False is a pan: only the item moves unless a zoom is also queued."""
+        self._pixels_dirty |= pixels
+        if self._render_pending:
+            return
+        self._render_pending = True
+        self.canvas.after_idle(self._do_render)
+
+    def _do_render(self):
+        self._render_pending = False
+        if self._pixels_dirty:
+            self._pixels_dirty = False
+            self._render_photo()
+        elif self.cached_image:
+            self._render_position()
+
+    def _settle(self):
+        """End of interaction: redraw once at full quality."""
+        self._settle_job = None
+        if self._interactive:
+            self._interactive = False
+            self._schedule_render()
+
     def _clamp_pan(self):
         """Keep image on screen but allow full panning when zoomed"""
-        if self.base_display_w == 0:
-            return
-        display_w = self.base_display_w * self.zoom_level
-        display_h = self.base_display_h * self.zoom_level
-        
+        # Limits come from _set_zoom; this runs on every drag event, so no calls here
+        mx, my = self._max_pan_x, self._max_pan_y
+        px, py = self.pan_x, self.pan_y
+        self.pan_x = -mx if px < -mx else (mx if px > mx else px)
+        self.pan_y = -my if py < -my else (my if py > my else py)
+
+    def _set_zoom(self, zoom: float):
+        """Set the zoom level (clamped) and the display size that goes with it."""
+        self.zoom_level = max(self.min_zoom, min(self.max_zoom, zoom))
+        self._display_w = max(1, int(self.base_display_w * self.zoom_level))
+        self._display_h = max(1, int(self.base_display_h * self.zoom_level))
         # Allow panning up to image edge, with some margin for buttons
         # When zoomed in (image larger than viewport), allow panning to see edges
-        visible_w = self.width * 0.75  # Account for side buttons
-        visible_h = self.height * 0.70  # Account for header/footer
-        
-        if display_w > visible_w:
-            max_pan_x = (display_w - visible_w) / 2
-        else:
-            max_pan_x = 0
-            
-        if display_h > visible_h:
-            max_pan_y = (display_h - visible_h) / 2
+        if self.base_display_w:
+            self._max_pan_x = max(0.0, (self._display_w - self._visible_w) * 0.5)
+            self._max_pan_y = max(0.0, (self._display_h - self._visible_h) * 0.5)
         else:
-            max_pan_y = 0
-            
-        self.pan_x = max(-max_pan_x, min(max_pan_x, self.pan_x))
-        self.pan_y = max(-max_pan_y, min(max_pan_y, self.pan_y))
+            self._max_pan_x = self._max_pan_y = 0.0
 
     def _update_zoom_indicator(self):
         """Update zoom percentage display"""
@@ -1437,15 +2570,19 @@ class PhotoZoomViewer:
     def _switch_photo(self, photo_idx: int):
         """Switch to a different photo in gallery"""
         if 0 <= photo_idx < len(self.photos):
+            path = self.photos[photo_idx]
+            entry = self._get_scaled(path)
+            if entry is None:
+                return
             self.current_idx = photo_idx
-            with Image.open(self.photos[photo_idx]) as img:
-                self.original_image = img.copy()
-            self.zoom_level = 1.0
+            self.cached_image, self.cached_hi, self.base_display_w, self.base_display_h = entry
+            self._render_cache.clear()
+            self._set_zoom(1.0)
             self.pan_x = 0.0
             self.pan_y = 0.0
-            self._cache_image()
             self._render_photo()
             self._update_photo_counter()
+            self._preload_neighbors()
             
             # Notify callback if set (for updating button states)
             if hasattr(self, 'on_photo_changed') and self.on_photo_changed:
@@ -1453,27 +2590,38 @@ class PhotoZoomViewer:
 
     def _on_mousewheel(self, event):
         """Simple zoom on mouse wheel"""
+        # Wheel events arrive in bursts: count the ticks and apply them together
+        self._wheel_steps += 1 if event.delta > 0 else -1
+        self._wheel_pos = (event.x, event.y)
+        if self._wheel_job is None:
+            self._wheel_job = self.canvas.after(15, self._apply_wheel)
+
+    def _apply_wheel(self):
+        """Apply the wheel ticks accumulated since the first one, with a single redraw."""
+        steps, (mouse_x, mouse_y) = self._wheel_steps, self._wheel_pos
+        self._wheel_steps = 0
+        self._wheel_job = None
         try:
             old_zoom = self.zoom_level
-            if event.delta > 0:
-                self.zoom_level *= 1.2
-            else:
-                self.zoom_level *= 0.83
-            
-            self.zoom_level = max(self.min_zoom, min(self.max_zoom, self.zoom_level))
+            self._set_zoom(old_zoom * (1.2 ** steps if steps > 0 else 0.83 ** -steps))
             
             # Zoom toward mouse position
             if old_zoom != self.zoom_level:
-                img_center_x = self.width // 2 + self.pan_x
-                img_center_y = self.height // 2 + self.pan_y
-                mouse_offset_x = event.x - img_center_x
-                mouse_offset_y = event.y - img_center_y
+                img_center_x = self._cx0 + self.pan_x
+                img_center_y = self._cy0 + self.pan_y
+                mouse_offset_x = mouse_x - img_center_x
+                mouse_offset_y = mouse_y - img_center_y
                 zoom_ratio = self.zoom_level / old_zoom
                 self.pan_x = self.pan_x - mouse_offset_x * (zoom_ratio - 1)
                 self.pan_y = self.pan_y - mouse_offset_y * (zoom_ratio - 1)
             
             self._clamp_pan()
-            self._render_photo()
+            # Wheel has no release event: refine 150ms after the last tick
+            self._interactive = True
+            if self._settle_job:
+                self.canvas.after_cancel(self._settle_job)
+            self._settle_job = self.canvas.after(150, self._settle)
+            self._schedule_render()
         except Exception as e:
             write_log(f"Zoom error: {e}")
 
@@ -1490,11 +2638,12 @@ class PhotoZoomViewer:
             self.pan_y += dy
             self._clamp_pan()
             self.drag_start = (event.x, event.y)
-            self._render_photo()
+            self._schedule_render(pixels=False)
 
     def _on_mouse_release(self, event):
         """End drag"""
         self.drag_start = None
+        self._settle()
 
     def _on_double_click(self, event):
         """Double-click to toggle zoom"""
@@ -1503,14 +2652,14 @@ class PhotoZoomViewer:
             return
         
         if self.zoom_level > 1.2:
-            self.zoom_level = 1.0
+            self._set_zoom(1.0)
             self.pan_x = 0.0
             self.pan_y = 0.0
         else:
             old_zoom = self.zoom_level
-            self.zoom_level = 2.0
-            img_center_x = self.width // 2 + self.pan_x
-            img_center_y = self.height // 2 + self.pan_y
+            self._set_zoom(2.0)
+            img_center_x = self._cx0 + self.pan_x
+            img_center_y = self._cy0 + self.pan_y
             click_offset_x = event.x - img_center_x
             click_offset_y = event.y - img_center_y
             zoom_ratio = self.zoom_level / old_zoom
@@ -1518,12 +2667,19 @@ class PhotoZoomViewer:
             self.pan_y = self.pan_y - click_offset_y * (zoom_ratio - 1)
         
         self._clamp_pan()
-        self._render_photo()
+        self._schedule_render()
 
     def create_control_buttons(self):
         """Create modern control buttons with cool styling"""
         try:
-            self.hide_control_buttons()
+            if self._buttons_built:
+                # Built once; later visits just unhide them (and put them back on top)
+                for tag in ("zoom_button", "zoom_ui"):
+                    self.canvas.itemconfigure(tag, state="normal")
+                    self.canvas.tag_raise(tag)
+                self._update_photo_counter()
+                self._update_zoom_indicator()
+                return
             
             # Gallery header bar at top
             header_y = 50
@@ -1568,6 +2724,7 @@ class PhotoZoomViewer:
             # Photo counter and zoom indicator
             self._update_photo_counter()
             self._update_zoom_indicator()
+            self._buttons_built = True
 
         except Exception as e:
             write_log(f"Error creating control buttons: {e}")
@@ -1607,29 +2764,26 @@ class PhotoZoomViewer:
     def hide_control_buttons(self):
         """Hide control buttons and zoom UI"""
         try:
-            self.canvas.delete("zoom_button")
-            self.canvas.delete("zoom_ui")
-            self.control_button_ids = {}
-            self.zoom_text_id = None
-            self.photo_counter_id = None
+            self.canvas.itemconfigure("zoom_button", state="hidden")
+            self.canvas.itemconfigure("zoom_ui", state="hidden")
         except Exception:
             pass
 
     def _touch_zoom_in(self):
         """Zoom in button"""
-        self.zoom_level = min(self.zoom_level * 1.3, self.max_zoom)
+        self._set_zoom(self.zoom_level * 1.3)
         self._clamp_pan()
-        self._render_photo()
+        self._schedule_render()
 
     def _touch_zoom_out(self):
         """Zoom out button"""
-        self.zoom_level = max(self.zoom_level * 0.77, self.min_zoom)
+        self._set_zoom(self.zoom_level * 0.77)
         self._clamp_pan()
-        self._render_photo()
+        self._schedule_render()
 
     def _touch_zoom_reset(self):
         """Reset zoom and pan"""
-        self.zoom_level = 1.0
+        self._set_zoom(1.0)
         self.pan_x = 0.0
         self.pan_y = 0.0
         self._render_photo()
@@ -1650,7 +2804,8 @@ class PhotoZoomViewer:
 # ============================================================================
 
 class PhotoBooth:
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: tk.Tk, setup_future: Optional[Future] = None):
+        _load_pil()
         self.root = root
         self.root.title("New Year Sparkle Booth 2026")
         self.root.attributes("-fullscreen", True)
@@ -1668,12 +2823,23 @@ class PhotoBooth:
         self.last_retry_time = 0
         self.zoom_viewer = None  # Will be initialized after UI setup
         self.snow_paused = False  # Pause snow during photo view for performance
-        
-        # Threading lock to prevent race conditions on camera reconnect
-        self.camera_reconnect_lock = threading.Lock()
+        self._animate_parked = False  # animate() stopped for RESULT; update_ui_state resumes it
+        self._shown: dict = {}  # item/tag -> state last applied by update_ui_state
+        self._decor_animated = True  # Year pulse is on screen
+        # Names already in DRIVE_DIR, listed once: the Drive mount can take tens of ms
+        # per stat, and show_buttons runs on every gallery step. Kept current by
+        # _save_thread and action_delete.
+        self._uploaded_set = self._list_uploaded()
+        
+        # Threading lock to prevent race conditions on camera reconnect (re-entrant so
+        # _reconnect_camera can be called with it already held)
+        self.camera_reconnect_lock = threading.RLock()
+        self._last_full_setup = 0.0  # monotonic time of the last successful setup + connect
         self.pause_keepalive = False  # Pause keepalive during active capture
 
         self.camera_manager = CameraManager()
+        # Camera setup kicked off by main() while the UI is being built
+        self._setup_future = setup_future
 
         self.setup_canvas()
         self.setup_snowflakes()
@@ -1698,103 +2864,37 @@ class PhotoBooth:
     def setup_canvas(self):
         self.canvas = Canvas(self.root, bg=THEME_BG, highlightthickness=0)
         self.canvas.place(x=0, y=0, width=self.width, height=self.height)
+        ThemedDialog.bind_canvas(self.canvas)
 
     def setup_snowflakes(self):
-        self.snowflakes = [Snowflake(self.canvas, self.width, self.height) for _ in range(SNOW_COUNT)]
+        self.snowflakes = SnowflakeField(self.canvas, self.width, self.height)
 
     def setup_ui_elements(self):
         center_x = self.width / 2
         
         # Animation state for pulsing effects
         self.animation_frame = 0
-        self.twinkling_stars = []
-        
-        # Create twinkling stars around the screen
-        self._create_twinkling_stars()
-        
-        # Title with clean shadow (not messy glow)
-        title_y = self.height * 0.08
-        
-        # Shadow layer (single, offset)
-        self.canvas.create_text(
-            center_x + 3, title_y + 3,
-            text="HAPPY NEW YEAR",
-            font=(FONT_FAMILY, TITLE_SIZE - 10, "bold"),
-            fill="#1a1a2e",
-            tags="ui_shadow"
-        )
-        
-        # Main title - clean and readable
-        self.ui_title = self.canvas.create_text(
-            center_x, title_y,
-            text="HAPPY NEW YEAR",
-            font=(FONT_FAMILY, TITLE_SIZE - 10, "bold"),
-            fill=THEME_TEXT,
-            tags="ui"
-        )
         
-        # Large year "2026" with pulsing effect
+        # Title, shadows, decorative lines and stars never change: one pre-rendered image
         year_y = self.height * 0.20
+        self.ui_title = self._create_static_layer(center_x, year_y)
         
-        # Year shadow
-        self.canvas.create_text(
-            center_x + 4, year_y + 4,
-            text="2026",
-            font=(FONT_FAMILY, 140, "bold"),
-            fill="#1a1a2e",
-            tags="ui_shadow"
-        )
-        
-        # Year main text (will be animated)
+        # Year main text (will be animated), over its shadow in the static layer
         self.ui_year = self.canvas.create_text(
             center_x, year_y,
             text="2026",
             font=(FONT_FAMILY, 140, "bold"),
             fill=THEME_ACCENT,
-            tags="ui_year"
+            tags=("ui_year", "decor")
         )
         
-        # Decorative sparkle line
-        line_y = self.height * 0.32
-        line_length = 250
-        
-        # Left line with gradient effect (multiple lines)
-        for i, alpha in enumerate([0.3, 0.5, 0.7, 1.0]):
-            offset = i * 60
-            color = THEME_ACCENT if alpha == 1.0 else "#997a00"
-            self.canvas.create_line(
-                center_x - line_length - offset, line_y,
-                center_x - 80 - offset, line_y,
-                fill=color, width=2, tags="ui_deco"
-            )
-        
-        # Center diamond
-        diamond_size = 12
-        self.canvas.create_polygon(
-            center_x, line_y - diamond_size,
-            center_x + diamond_size, line_y,
-            center_x, line_y + diamond_size,
-            center_x - diamond_size, line_y,
-            fill=THEME_ACCENT, outline="", tags="ui_deco"
-        )
-        
-        # Right line
-        for i, alpha in enumerate([0.3, 0.5, 0.7, 1.0]):
-            offset = i * 60
-            color = THEME_ACCENT if alpha == 1.0 else "#997a00"
-            self.canvas.create_line(
-                center_x + 80 + offset, line_y,
-                center_x + line_length + offset, line_y,
-                fill=color, width=2, tags="ui_deco"
-            )
-        
         # Instruction text
         self.ui_instruction = self.canvas.create_text(
             center_x, self.height * 0.38,
             text="Initializing...",
             font=(FONT_FAMILY, SUBTITLE_SIZE + 2, "bold"),
             fill=THEME_TEXT,
-            tags="ui"
+            tags=("ui", "hud")
         )
         
         # Status text
@@ -1803,16 +2903,15 @@ class PhotoBooth:
             text="",
             font=(FONT_FAMILY, STATUS_SIZE),
             fill=THEME_SUCCESS,
-            tags="ui"
+            tags=("ui", "hud")
         )
         
-        # Countdown display
-        self.ui_countdown = self.canvas.create_text(
+        # Countdown display: the digits are pre-rendered, each tick only swaps image=
+        self._countdown_imgs = {n: self._text_image(str(n), COUNTDOWN_SIZE + 60, THEME_ACCENT)
+                                for n in (1, 2, 3, 4, 5)}
+        self.ui_countdown = self.canvas.create_image(
             center_x, self.height * 0.55,
-            text="",
-            font=(FONT_FAMILY, COUNTDOWN_SIZE + 60, "bold"),
-            fill=THEME_ACCENT,
-            tags="ui"
+            tags=("ui", "hud")
         )
         
         # Countdown message
@@ -1822,7 +2921,7 @@ class PhotoBooth:
             font=(FONT_FAMILY, 72, "bold"),
             fill=THEME_ACCENT,
             state="hidden",
-            tags="ui"
+            tags=("ui", "hud")
         )
         
         # Photo display
@@ -1835,9 +2934,50 @@ class PhotoBooth:
         
         # Setup logos and viewer
         self._setup_logos_and_viewer()
+        
+        # Final z-order, set once: snow under everything, the rest in creation order.
+        # Moving items never restacks them, and later items (gallery controls,
+        # dialogs) are created on top, so nothing needs re-lowering per frame.
+        self.canvas.tag_lower("snow")
     
-    def _create_twinkling_stars(self):
-        """Create decorative twinkling stars around the edges"""
+    def _create_static_layer(self, center_x: float, year_y: float) -> int:
+        """Draw the home-screen title, shadows, lines, diamond and stars into one PhotoImage.
+
+        Tk re-rasterizes every text item in a damaged region, and the snow damages
+        these constantly; a single image item is just a blit."""
+        from PIL import ImageDraw
+        px_per_pt = self.root.winfo_fpixels("1p")  # Tk font sizes are points
+        title_font = _pil_font(round((TITLE_SIZE - 10) * px_per_pt), *BOLD_FONT_FILES)
+        year_font = _pil_font(round(140 * px_per_pt), *BOLD_FONT_FILES)
+        
+        im = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(im)
+        
+        # Title with clean shadow (not messy glow)
+        title_y = self.height * 0.08
+        draw.text((center_x + 3, title_y + 3), "HAPPY NEW YEAR", font=title_font, fill="#1a1a2e", anchor="mm")
+        draw.text((center_x, title_y), "HAPPY NEW YEAR", font=title_font, fill=THEME_TEXT, anchor="mm")
+        
+        # Year shadow (the year itself is a live text item so it can pulse)
+        draw.text((center_x + 4, year_y + 4), "2026", font=year_font, fill="#1a1a2e", anchor="mm")
+        
+        # Decorative sparkle line: gradient of short segments either side of a diamond
+        line_y = self.height * 0.32
+        line_length = 250
+        for i, alpha in enumerate([0.3, 0.5, 0.7, 1.0]):
+            offset = i * 60
+            color = THEME_ACCENT if alpha == 1.0 else "#997a00"
+            draw.line((center_x - line_length - offset, line_y, center_x - 80 - offset, line_y), fill=color, width=2)
+            draw.line((center_x + 80 + offset, line_y, center_x + line_length + offset, line_y), fill=color, width=2)
+        diamond_size = 12
+        draw.polygon([
+            (center_x, line_y - diamond_size),
+            (center_x + diamond_size, line_y),
+            (center_x, line_y + diamond_size),
+            (center_x - diamond_size, line_y),
+        ], fill=THEME_ACCENT)
+        
+        # Stars around the edges, at their full (formerly peak-of-twinkle) size
         star_positions = [
             (0.05, 0.10), (0.95, 0.10),
             (0.08, 0.25), (0.92, 0.25),
@@ -1848,73 +2988,95 @@ class PhotoBooth:
             (0.15, 0.05), (0.85, 0.05),
             (0.25, 0.08), (0.75, 0.08),
         ]
-        
         for rel_x, rel_y in star_positions:
-            x = self.width * rel_x
-            y = self.height * rel_y
-            size = random.randint(6, 12)
+            star_font = _pil_font(round(random.randint(6, 12) * px_per_pt), "seguisym.ttf", *BOLD_FONT_FILES)
             color = random.choice([THEME_ACCENT, "#FFFFFF", THEME_ACCENT_2, THEME_GLOW])
-            
-            star_id = self.canvas.create_text(
-                x, y, text="✦",
-                font=("Arial", size, "bold"),
-                fill=color,
-                tags="twinkle_star"
-            )
-            self.twinkling_stars.append({
-                'id': star_id,
-                'base_size': size,
-                'phase': random.uniform(0, 6.28),
-                'speed': random.uniform(0.05, 0.15)
-            })
+            draw.text((self.width * rel_x, self.height * rel_y), "✦", font=star_font, fill=color, anchor="mm")
+        
+        # Crop to the drawn area so Tk only composites that much over the snow
+        left, top, right, bottom = im.getbbox() or (0, 0, 1, 1)
+        self._static_layer = ImageTk.PhotoImage(im.crop((left, top, right, bottom)))
+        return self.canvas.create_image(left, top, anchor="nw", image=self._static_layer,
+                                       tags=("ui_static", "decor"))
+
+    def _text_image(self, text: str, size: int, fill: str, fonts: tuple = BOLD_FONT_FILES):
+        """text at a Tk font size (points) as a PhotoImage trimmed to the glyphs."""
+        from PIL import ImageDraw
+        font = _pil_font(max(1, round(size * self.root.winfo_fpixels("1p"))), *fonts)
+        left, top, right, bottom = font.getbbox(text)
+        im = Image.new("RGBA", (max(1, right - left), max(1, bottom - top)), (0, 0, 0, 0))
+        ImageDraw.Draw(im).text((-left, -top), text, font=font, fill=fill)
+        return ImageTk.PhotoImage(im)
 
     def _setup_logos_and_viewer(self):
         """Setup logos and photo viewer - called from setup_ui_elements"""
         # Initialize zoom viewer and load existing photos
         self.zoom_viewer = PhotoZoomViewer(self.canvas, self.ui_photo, self.width, self.height)
-        self.zoom_viewer.load_existing_photos(PHOTO_DIR)
+        self.zoom_viewer.load_existing_photos_async(PHOTO_DIR)
         
         # Set callback to update button states when photo changes
         self.zoom_viewer.on_photo_changed = self._on_gallery_photo_changed
 
-        # Logo
+        # Logos: place the items now, fill them in once decoded off the Tk thread
+        max_size = min(self.width * 0.35, self.height * 0.28)  # Same for both logos
         self.logo_image = None
         logo_path = resolve_logo_path()
         if logo_path:
-            try:
-                img = Image.open(logo_path)
-                max_size = min(self.width * 0.35, self.height * 0.28)
-                ratio = min(max_size / img.width, max_size / img.height)
-                new_w = int(img.width * ratio)
-                new_h = int(img.height * ratio)
-                img = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-                self.logo_image = ImageTk.PhotoImage(img)
-                logo_x = self.width * 0.12
-                logo_y = self.height * 0.16
-                self.ui_logo = self.canvas.create_image(logo_x, logo_y, image=self.logo_image, tags="logo")
-                self.canvas.tag_lower("logo", "snow")
-            except Exception as e:
-                write_log(f"logo failed: {e}")
+            logo_x = self.width * 0.12
+            logo_y = self.height * 0.16
+            self.ui_logo = self.canvas.create_image(logo_x, logo_y, tags=("logo", "brand"))
+            self._load_logo_async(logo_path, max_size, "logo_image", self.ui_logo, "logo")
         
         # Promotional Logo (right side)
         self.promo_logo_image = None
         promo_path = resolve_promo_logo_path()
         if promo_path:
+            promo_x = self.width * 0.88  # Mirror of 0.12
+            promo_y = self.height * 0.16  # Same as main logo
+            self.ui_promo = self.canvas.create_image(promo_x, promo_y, tags=("promo", "brand"))
+            self._load_logo_async(promo_path, max_size, "promo_logo_image", self.ui_promo, "promo logo")
+
+    @staticmethod
+    def _scaled_logo(path: str, max_size: float):
+        """Logo fitted into max_size, from a PNG cache so LANCZOS only runs when it changes."""
+        img = Image.open(path)  # Header only until load()
+        ratio = min(max_size / img.width, max_size / img.height)
+        new_w = int(img.width * ratio)
+        new_h = int(img.height * ratio)
+        tag = hashlib.sha1(path.encode()).hexdigest()[:12]
+        cache_path = os.path.join(TEMP_DIR, "cache", f"logo_{tag}_{new_w}x{new_h}.png")
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+                img.close()
+                cached = Image.open(cache_path)
+                cached.load()
+                return cached
+        except OSError:
+            pass  # No cache yet
+        if img.format == "JPEG":
+            img.draft("RGB", (new_w, new_h))  # DCT-scaled decode of a photo-style logo
+        img = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+        try:
+            img.save(cache_path, "PNG", optimize=True)
+        except Exception as e:
+            write_log(f"Logo cache save failed: {e}")
+        return img
+
+    def _load_logo_async(self, path: str, max_size: float, attr: str, item: int, label: str):
+        def show(img):
+            photo = ImageTk.PhotoImage(img)
+            setattr(self, attr, photo)  # Keep the reference, or Tk draws nothing
+            self.canvas.itemconfig(item, image=photo)
+            write_log(f"Loaded {label}: {path}")
+
+        def load():
             try:
-                img = Image.open(promo_path)
-                max_size = min(self.width * 0.35, self.height * 0.28)  # Same as main logo
-                ratio = min(max_size / img.width, max_size / img.height)
-                new_w = int(img.width * ratio)
-                new_h = int(img.height * ratio)
-                img = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-                self.promo_logo_image = ImageTk.PhotoImage(img)
-                promo_x = self.width * 0.88  # Mirror of 0.12
-                promo_y = self.height * 0.16  # Same as main logo
-                self.ui_promo = self.canvas.create_image(promo_x, promo_y, image=self.promo_logo_image, tags="promo")
-                self.canvas.tag_lower("promo", "snow")
-                write_log(f"Loaded promotional logo: {promo_path}")
+                img = self._scaled_logo(path, max_size)
             except Exception as e:
-                write_log(f"promo logo failed: {e}")
+                write_log(f"{label} failed: {e}")
+                return
+            self.root.after(0, show, img)
+        run_in_background(load)
 
     def setup_buttons(self):
         btn_font = (FONT_FAMILY, BUTTON_SIZE + 2, "bold")
@@ -1925,6 +3087,9 @@ class PhotoBooth:
             "cursor": "hand2",
             "borderwidth": 0,
             "highlightthickness": 0,
+            # Hidden buttons stay mapped below the canvas: keep them out of the Tab
+            # order, so Tab + Space can't press one that isn't on screen
+            "takefocus": 0,
         }
         
         # Action buttons for RESULT mode - Premium styling
@@ -1966,22 +3131,39 @@ class PhotoBooth:
                                 activebackground="#00F5B8", activeforeground="white",
                                 padx=50, pady=25, **btn_style,
                                 command=self.start_photo_workflow)
-        self.hide_buttons()
+
+        # Every button is placed once here; showing or hiding a group just restacks
+        # it above or below the full-window canvas, with no geometry-manager relayout
+        self._home_buttons = (self.btn_start, self.btn_view_photos)
+        self._result_buttons = (self.btn_delete, self.btn_save, self.btn_print, self.btn_new)
+        self.btn_start.place(relx=0.5, rely=0.5, anchor="center")
+        self.btn_view_photos.place(relx=0.5, rely=0.92, anchor="center")
+        # 4 result buttons evenly spaced
+        for btn, relx in zip(self._result_buttons, (0.12, 0.37, 0.62, 0.87)):
+            btn.place(relx=relx, rely=0.92, anchor="center")
+            btn.lower(self.canvas)
+        for btn in self._home_buttons:
+            btn.lower(self.canvas)
+        self._button_group = ()
 
     def init_camera(self):
         # Clean up old temp files on startup
-        cleanup_old_temp_files(max_age_days=0)
+        cleanup_old_temp_files(max_age_days=TEMP_MAX_AGE_DAYS)
         self.update_ui_state("INIT")
         threading.Thread(target=self._init_camera_thread, daemon=True).start()
 
     def _init_camera_thread(self):
         try:
-            # Run the complete automated setup
-            if fully_automated_camera_setup():
+            # Run the complete automated setup, reusing the one started at launch
+            pending, self._setup_future = self._setup_future, None
+            setup_ok = pending.result() if pending is not None else fully_automated_camera_setup()
+            if setup_ok:
                 # Now connect via camera manager
-                if self.camera_manager.connect_best():
+                if self._connect_camera():
                     name = self.camera_manager.get_name()
                     self.camera_ready = True
+                    # Open the gphoto2 shell + PTP session now, not on the first shot
+                    self.camera_manager.prepare_async()
                     self.root.after(0, lambda: self.update_ui_state("READY", name))
                 else:
                     self.camera_ready = False
@@ -1994,26 +3176,41 @@ class PhotoBooth:
             self.camera_ready = False
             self.root.after(0, lambda: self.update_ui_state("ERROR", "Connection error"))
 
+    def _connect_camera(self) -> bool:
+        """connect_best(), remembering when a full setup last ended in a connection."""
+        if not self.camera_manager.connect_best():
+            return False
+        self._last_full_setup = time.monotonic()
+        return True
+
+    def _reconnect_camera(self, max_age: float = 0.0) -> bool:
+        """Full automated setup + connect, one at a time. With max_age, a setup that
+        succeeded less than max_age seconds ago is reused while the camera still answers."""
+        with self.camera_reconnect_lock:
+            age = time.monotonic() - self._last_full_setup
+            if self._last_full_setup and age < max_age and self.camera_manager.is_connected():
+                write_log(f"Skipping camera setup (last one {age:.0f}s ago)")
+                return True
+            return fully_automated_camera_setup() and self._connect_camera()
+
     def start_camera_monitoring(self):
         """Background health check and keepalive."""
         self.monitoring_camera = True
-        self.last_keepalive = time.time()
+        self.last_keepalive = time.monotonic()
         threading.Thread(target=self._monitor_camera_health, daemon=True).start()
 
     def _camera_keepalive(self):
         """Send a lightweight command to keep the camera connection alive."""
         try:
-            # Use --auto-detect which is proven to work for Nikon Z6_3
-            # The --get-config command was timing out for this camera
-            result = subprocess.run(
-                ["wsl", "-d", WSL_DISTRO, "gphoto2", "--auto-detect"],
-                capture_output=True,
-                timeout=10  # Increased timeout for more reliability
-            )
-            # Check if camera is detected in output
-            if result.returncode == 0 and b"usb:" in result.stdout:
-                return True
-            return False
+            # With a gphoto2 shell open, ask it: no gphoto2 start-up or USB re-scan, and
+            # it exercises the very session the next capture will use
+            cam = self.camera_manager.camera
+            session = getattr(cam, "session", None)
+            if session is not None and session.alive():
+                return session.ping()
+            # No session to ask: check the camera is still on the USB bus without
+            # probing it, so the monitor never competes with a capture for the device
+            return camera_usb_present()
         except Exception as e:
             write_log(f"Keepalive failed: {e}")
             return False
@@ -2029,7 +3226,7 @@ class PhotoBooth:
                 # Keepalive in READY or RESULT mode (not during active capture)
                 if self.mode in ("READY", "RESULT") and self.camera_ready and not getattr(self, 'capture_in_progress', False):
                     # Keepalive every 60 seconds (was 15, but that was too aggressive)
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     if current_time - self.last_keepalive > 60:
                         if self._camera_keepalive():
                             self.last_keepalive = current_time
@@ -2040,8 +3237,7 @@ class PhotoBooth:
                                 try:
                                     write_log("Keepalive failed, auto-reconnecting...")
                                     # Immediate reconnect attempt
-                                    if fully_automated_camera_setup():
-                                        self.camera_manager.connect_best()
+                                    if self._reconnect_camera():
                                         write_log("Camera auto-reconnected successfully")
                                     else:
                                         write_log("Auto-reconnect failed, will retry on next check")
@@ -2057,104 +3253,94 @@ class PhotoBooth:
 
     def update_ui_state(self, state: str, message: str = ""):
         self.mode = state
-        self.canvas.itemconfig(self.ui_title, state="normal")
-        self.canvas.itemconfig(self.ui_instruction, state="hidden")
-        self.canvas.itemconfig(self.ui_status, state="hidden")
-        self.canvas.itemconfig(self.ui_countdown, state="hidden")
-        self.canvas.itemconfig(self.ui_countdown_msg, state="hidden")
-        self.canvas.itemconfig(self.ui_photo, state="hidden")
-        # Show snow for non-RESULT states
-        self.canvas.itemconfig("snow", state="normal")
+        # Nothing animated is visible over the photo; countdown hides the decorations
+        self.snow_paused = state == "RESULT"
+        if self._animate_parked and not self.snow_paused:
+            self._animate_parked = False
+            self.root.after(ANIMATION_FPS, self.animate)
+        if state != "ERROR":  # ERROR keeps whatever the previous screen showed
+            self._decor_animated = state in ("INIT", "READY")
+        # Group tags: "hud" = instruction/status/countdown texts, "decor" = title, year
+        # and stars, "brand" = both logos; one Tk call per group
+        self.canvas.itemconfig("hud", state="hidden")
+        # Photo only in RESULT; snow everywhere else (hidden for a cleaner photo view)
+        self._set_state(self.ui_photo, "normal" if state == "RESULT" else "hidden")
+        self._set_state("snow", "hidden" if state == "RESULT" else "normal")
         self.hide_buttons()
 
+        if state in ("INIT", "ERROR"):
+            # Title back, the rest of the decorations as they were
+            self.canvas.itemconfig(self.ui_title, state="normal")
+            self._shown.pop("decor", None)  # "decor" no longer has one state
         if state == "INIT":
             self.canvas.itemconfig(self.ui_instruction, text="Setting up the countdown...", state="normal")
             self.canvas.itemconfig(self.ui_status, text="⏳ Binding & attaching camera...", state="normal")
         elif state == "READY":
             # Restore ALL decorative elements when returning to home
-            self.canvas.itemconfig("ui_year", state="normal")
-            self.canvas.itemconfig("ui_shadow", state="normal")
-            self.canvas.itemconfig("ui_deco", state="normal")
-            self.canvas.itemconfig("twinkle_star", state="normal")
-            self.canvas.itemconfig("logo", state="normal")
-            self.canvas.itemconfig("promo", state="normal")
-            if hasattr(self, 'ui_year'):
-                self.canvas.itemconfig(self.ui_year, state="normal")
+            self._set_state("decor", "normal")
+            self._set_state("brand", "normal")
             # Restore logos to original top position
             if hasattr(self, 'ui_logo'):
                 self.canvas.coords(self.ui_logo, self.width * 0.12, self.height * 0.16)
             if hasattr(self, 'ui_promo'):
                 self.canvas.coords(self.ui_promo, self.width * 0.88, self.height * 0.16)
-            # Clean home screen - no status text, just buttons
-            self.canvas.itemconfig(self.ui_instruction, text="", state="hidden")
-            self.canvas.itemconfig(self.ui_status, text="", state="hidden")
+            # Clean home screen - no status text, just buttons (hud is already hidden)
+            self.canvas.itemconfig(self.ui_instruction, text="")
+            self.canvas.itemconfig(self.ui_status, text="")
             # Show START and VIEW PHOTOS buttons on home screen
-            self.btn_start.place(relx=0.5, rely=0.5, anchor="center")
-            self.btn_view_photos.place(relx=0.5, rely=0.92, anchor="center")
+            self._show_button_group(self._home_buttons)
         elif state == "COUNTDOWN":
             # Hide year and title during countdown for cleaner look
-            self.canvas.itemconfig("ui_year", state="hidden")
-            self.canvas.itemconfig("ui_shadow", state="hidden")
-            self.canvas.itemconfig("ui_deco", state="hidden")
-            self.canvas.itemconfig("twinkle_star", state="hidden")
-            self.canvas.itemconfig(self.ui_title, state="hidden")
-            if hasattr(self, 'ui_year'):
-                self.canvas.itemconfig(self.ui_year, state="hidden")
+            self._set_state("decor", "hidden")
             self.canvas.itemconfig(self.ui_countdown, state="normal")
             # Move status text to instruction position (higher up)
             self.canvas.itemconfig(self.ui_instruction, text="✨ Get Ready! ✨", fill=THEME_ACCENT, state="normal")
         elif state == "RESULT":
             # Hide decorative elements but keep logos (repositioned)
-            self.canvas.itemconfig(self.ui_title, state="hidden")
-            self.canvas.itemconfig("ui_year", state="hidden")
-            self.canvas.itemconfig("ui_shadow", state="hidden")
-            self.canvas.itemconfig("ui_deco", state="hidden")
-            self.canvas.itemconfig("twinkle_star", state="hidden")
-            if hasattr(self, 'ui_year'):
-                self.canvas.itemconfig(self.ui_year, state="hidden")
+            self._set_state("decor", "hidden")
             
             # Move logos to just below header for gallery view
             if hasattr(self, 'ui_logo'):
                 self.canvas.coords(self.ui_logo, self.width * 0.10, self.height * 0.22)
-                self.canvas.itemconfig("logo", state="normal")
             if hasattr(self, 'ui_promo'):
                 self.canvas.coords(self.ui_promo, self.width * 0.90, self.height * 0.22)
-                self.canvas.itemconfig("promo", state="normal")
+            self._set_state("brand", "normal")
             
-            self.canvas.itemconfig(self.ui_photo, state="normal")
-            # Hide snow for cleaner photo view
-            self.canvas.itemconfig("snow", state="hidden")
             self.show_buttons()
             # Show touch-friendly control buttons for zoom/navigation
             if hasattr(self, 'zoom_viewer') and self.zoom_viewer:
                 self.zoom_viewer.create_control_buttons()
         elif state == "ERROR":
-            # Show snow again
-            self.canvas.itemconfig("snow", state="normal")
             self.canvas.itemconfig(self.ui_instruction, text="Tap to retry", fill=THEME_ACCENT, state="normal")
             self.canvas.itemconfig(self.ui_status, text=f"✗ {message}", fill=THEME_DANGER, state="normal")
 
+    def _set_state(self, item, state: str):
+        """itemconfig(state=...) for items/tags only update_ui_state shows or hides,
+        skipped when already applied: a state write repaints the items even if unchanged."""
+        if self._shown.get(item) != state:
+            self.canvas.itemconfig(item, state=state)
+            self._shown[item] = state
+
+    @staticmethod
+    def _list_uploaded() -> set:
+        try:
+            with os.scandir(DRIVE_DIR) as it:
+                return {e.name for e in it}
+        except OSError as e:
+            write_log(f"Could not list {DRIVE_DIR}: {e}")
+            return set()
+
     def show_buttons(self):
-        btn_y = 0.92
-        
         # Check if current photo is already uploaded
-        is_uploaded = False
-        if self.current_photo_path and os.path.exists(self.current_photo_path):
-            filename = os.path.basename(self.current_photo_path)
-            dest = os.path.join(DRIVE_DIR, filename)
-            is_uploaded = os.path.exists(dest)
+        is_uploaded = bool(self.current_photo_path) and \
+            os.path.basename(self.current_photo_path) in self._uploaded_set
         
         # Update upload button based on status
         if is_uploaded:
             self.btn_save.config(text="☁️ ✓ DONE", bg="#2D6A4F", fg="white", state="disabled")
         else:
             self.btn_save.config(text="☁️  UPLOAD", bg=THEME_SUCCESS, fg="white", state="normal")
-        
-        # 4 buttons evenly spaced
-        self.btn_delete.place(relx=0.12, rely=btn_y, anchor="center")
-        self.btn_save.place(relx=0.37, rely=btn_y, anchor="center")
-        self.btn_print.place(relx=0.62, rely=btn_y, anchor="center")
-        self.btn_new.place(relx=0.87, rely=btn_y, anchor="center")
+        self._show_button_group(self._result_buttons)
 
     def _on_gallery_photo_changed(self, new_photo_path: str):
         """Called when user navigates to a different photo in gallery"""
@@ -2164,12 +3350,23 @@ class PhotoBooth:
             self.show_buttons()
 
     def hide_buttons(self):
-        for btn in [self.btn_delete, self.btn_save, self.btn_print, self.btn_new, self.btn_view_photos, self.btn_start]:
-            btn.place_forget()
+        self._show_button_group(())
         # Hide touch control buttons too
         if hasattr(self, 'zoom_viewer') and self.zoom_viewer:
             self.zoom_viewer.hide_control_buttons()
 
+    def _show_button_group(self, group: tuple):
+        """Raise one group of the pre-placed buttons above the canvas and drop the
+        previous group below it; a no-op when that group is already showing."""
+        if group is self._button_group:
+            return
+        for btn in self._button_group:
+            if btn not in group:
+                btn.lower(self.canvas)
+        for btn in group:
+            btn.lift()
+        self._button_group = group
+
     def on_canvas_click(self, event):
         """Handle canvas clicks - only for error retry, NOT for photo capture"""
         # Photo capture is ONLY triggered by the TAP TO START button
@@ -2178,15 +3375,15 @@ class PhotoBooth:
             self.retry_camera()
 
     def start_photo_workflow(self):
-        if not self.camera_ready:
-            return
+        if not self.camera_ready or self.mode != "READY":
+            return  # START is only on the home screen
         
         self.update_ui_state("COUNTDOWN")  # Show countdown UI
         self.root.update()
         
         # Check if we need to reconnect or can skip it
         # If keepalive succeeded recently (within 90 seconds), skip reconnect
-        time_since_keepalive = time.time() - getattr(self, 'last_keepalive', 0)
+        time_since_keepalive = time.monotonic() - getattr(self, 'last_keepalive', 0)
         if time_since_keepalive < 90 and self.camera_manager.is_connected():
             write_log(f"Skipping reconnect (keepalive {time_since_keepalive:.0f}s ago)")
             # Start countdown directly
@@ -2217,16 +3414,13 @@ class PhotoBooth:
             
             # Show "Connecting" message instead of countdown
             self.root.after(0, lambda: self.canvas.itemconfig(self.ui_instruction, text="📷 Connecting Camera...", fill=THEME_TEXT))
-            self.root.after(0, lambda: self.canvas.itemconfig(self.ui_countdown, text="", state="hidden"))
+            self.root.after(0, lambda: self.canvas.itemconfig(self.ui_countdown, image="", state="hidden"))
             
-            # Acquire lock to prevent any other reconnection attempts
-            with self.camera_reconnect_lock:
-                # Force reattach to ensure fresh USB connection
-                if fully_automated_camera_setup():
-                    self.camera_manager.connect_best()
-                    write_log("Camera reconnected for capture")
-                else:
-                    write_log("Camera reconnect warning - proceeding anyway")
+            # Reattach for a fresh USB connection, unless setup (e.g. at startup) just did
+            if self._reconnect_camera(max_age=SETUP_FRESH_SECONDS):
+                write_log("Camera reconnected for capture")
+            else:
+                write_log("Camera reconnect warning - proceeding anyway")
             
             # Now show "Get Ready" and start countdown
             self.root.after(0, lambda: self.canvas.itemconfig(self.ui_instruction, text="✨ Get Ready! ✨", fill=THEME_ACCENT))
@@ -2242,8 +3436,13 @@ class PhotoBooth:
 
     def _countdown_and_capture(self):
         try:
+            # The countdown is dead time for the camera: bring its session up meanwhile.
+            # The shutter itself must still wait for "LOOK AT THE CAMERA!". Only for a
+            # connected camera: otherwise the check below replaces it after the countdown
+            if self.camera_manager.is_connected():
+                self.camera_manager.prepare_async()
             for i in [5, 4, 3, 2, 1]:
-                self.root.after(0, lambda v=i: self.canvas.itemconfig(self.ui_countdown, text=str(v)))
+                self.root.after(0, lambda v=i: self.canvas.itemconfig(self.ui_countdown, image=self._countdown_imgs[v]))
                 time.sleep(0.8)
             # Hide big countdown, show smaller message
             self.root.after(0, lambda: self.canvas.itemconfig(self.ui_countdown, state="hidden"))
@@ -2253,14 +3452,15 @@ class PhotoBooth:
             # Quick camera check before capture - reconnect if needed
             if not self.camera_manager.is_connected():
                 write_log("Camera not responding before capture, attempting reconnect...")
-                if fully_automated_camera_setup():
-                    self.camera_manager.connect_best()
+                if self._reconnect_camera():
                     write_log("Camera reconnected successfully")
                 else:
                     write_log("Camera reconnect failed")
 
             filename = f"IMG_{int(time.time())}.jpg"
-            save_path = os.path.join(os.path.join(TEMP_DIR, "captures"), filename)
+            # Every backend downloads into CAPTURE_DIR, on the same filesystem, and only a
+            # validated file is renamed to this gallery path: no copy, no partial shots
+            save_path = os.path.join(PHOTO_DIR, filename)
             write_log(f"Saving photo to: {save_path}")
             
             # Try capture with automatic retry on failure
@@ -2269,16 +3469,17 @@ class PhotoBooth:
                 if attempt > 0:
                     write_log(f"Retry attempt {attempt + 1}/3 - reconnecting camera...")
                     self.root.after(0, lambda: self.canvas.itemconfig(self.ui_countdown_msg, text="Reconnecting camera..."))
-                    # Force reconnect
-                    if fully_automated_camera_setup():
-                        self.camera_manager.connect_best()
+                    # Force reconnect: the capture just failed, so a recent setup proves nothing
+                    if self._reconnect_camera():
                         write_log("Camera reconnected for retry")
                         time.sleep(1)  # Brief pause after reconnect
                     else:
                         write_log("Reconnect failed, trying capture anyway")
                 
-                ok = self.camera_manager.capture(save_path)
-                write_log(f"Capture attempt {attempt + 1} result: {ok}")
+                result = self.camera_manager.capture(save_path)
+                ok = result.ok
+                write_log(f"Capture attempt {attempt + 1} result: {ok} "
+                          f"({result.size} bytes, {result.elapsed:.1f}s)")
                 if ok:
                     break
                 elif attempt < 2:
@@ -2286,25 +3487,17 @@ class PhotoBooth:
                     time.sleep(2)  # Wait before retry
             
             if ok:
-                write_log(f"Photo saved successfully, moving to gallery...")
-                # Move photo from temp to permanent gallery location
-                backup_path = os.path.join(PHOTO_DIR, os.path.basename(save_path))
-                try:
-                    shutil.move(save_path, backup_path)
-                    write_log(f"Photo moved to gallery: {backup_path}")
-                except Exception as e:
-                    write_log(f"Move failed, trying copy: {e}")
-                    try:
-                        shutil.copy2(save_path, backup_path)
-                        os.remove(save_path)  # Clean up temp file
-                        write_log(f"Photo copied to gallery: {backup_path}")
-                    except Exception as e2:
-                        write_log(f"Copy also failed: {e2}")
-                        backup_path = save_path  # Fall back to temp path
-                
-                # Set current photo to the gallery location (not temp)
-                self.current_photo_path = backup_path
-                self.root.after(0, self._show_captured_photo)
+                write_log(f"Photo saved to gallery: {save_path}")
+                self.current_photo_path = save_path
+                if self.zoom_viewer:
+                    # Decode + scale on the viewer's pool; the Tk thread only shows the
+                    # result, rather than blocking on a 24 MP decode in load_photo
+                    self.zoom_viewer.prefetch(save_path).add_done_callback(
+                        lambda _: self.root.after(0, self._show_captured_photo))
+                else:
+                    # No viewer: decode and fit here too, so only the PhotoImage is built on Tk
+                    img = self._fit_to_display(save_path)
+                    self.root.after(0, self._show_captured_photo, img)
             else:
                 write_log("All capture attempts failed, showing error...")
                 self.root.after(0, self.capture_failed)
@@ -2312,7 +3505,18 @@ class PhotoBooth:
             write_log(f"_countdown_and_capture exception: {e}")
             self.root.after(0, self.capture_failed)
 
-    def _show_captured_photo(self):
+    def _fit_to_display(self, path: str):
+        """Decode a photo fitted to the fallback display area (80% of the screen)."""
+        display_width = int(self.width * 0.8)
+        display_height = int(self.height * 0.8)
+        # DCT-scaled decode near the display size, then an in-place fit
+        img = PhotoZoomViewer._open_decoded(path, (display_width, display_height))
+        img.thumbnail((display_width, display_height), Image.Resampling.LANCZOS)
+        return img
+
+    def _show_captured_photo(self, img=None):
+        """Show the new capture; img is the fallback display image, already decoded
+        by the capture worker."""
         write_log("_show_captured_photo called")
         try:
             write_log(f"Loading photo from: {self.current_photo_path}")
@@ -2326,15 +3530,14 @@ class PhotoBooth:
             else:
                 write_log("zoom_viewer not available, using fallback...")
                 # Fallback if zoom_viewer not initialized
-                img = Image.open(self.current_photo_path)
-                display_width = int(self.width * 0.8)
-                display_height = int(self.height * 0.8)
-                ratio = min(display_width / img.width, display_height / img.height)
-                new_w = int(img.width * ratio)
-                new_h = int(img.height * ratio)
-                img_resized = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-                self.photo_display = ImageTk.PhotoImage(img_resized)
-                self.canvas.itemconfig(self.ui_photo, image=self.photo_display)
+                if img is None:
+                    img = self._fit_to_display(self.current_photo_path)
+                shown = getattr(self, "photo_display", None)
+                if shown is not None and (shown.width(), shown.height()) == img.size:
+                    shown.paste(img)  # Same size as the last shot: reuse the Tk image in place
+                else:
+                    self.photo_display = ImageTk.PhotoImage(img)
+                    self.canvas.itemconfig(self.ui_photo, image=self.photo_display)
                 write_log("Fallback photo display completed")
             write_log("Updating UI state to RESULT...")
             self.update_ui_state("RESULT")
@@ -2373,17 +3576,27 @@ class PhotoBooth:
                 self.btn_delete.config(text="🗑️ DELETING...", state="disabled")
                 self.root.update()
                 
+                removed = False
                 try:
                     # Delete local file
                     os.remove(photo_to_delete)
+                    removed = True
                     write_log(f"Deleted photo: {photo_to_delete}")
+                    if self.zoom_viewer:
+                        self.zoom_viewer.forget(photo_to_delete)
                     
                     # Also delete from cloud if it was uploaded
                     filename = os.path.basename(photo_to_delete)
                     cloud_path = os.path.join(DRIVE_DIR, filename)
-                    if os.path.exists(cloud_path):
+                    self._uploaded_set.discard(filename)
+                    # Just try: an exists() first would be one more stat on the Drive mount
+                    try:
                         os.remove(cloud_path)
                         write_log(f"Deleted from cloud: {cloud_path}")
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        write_log(f"Cloud delete warning: {e}")
                 except Exception as e:
                     write_log(f"Delete error: {e}")
                 
@@ -2393,7 +3606,11 @@ class PhotoBooth:
                 # Update gallery and show next photo if available
                 if hasattr(self, 'zoom_viewer') and self.zoom_viewer:
                     old_idx = self.zoom_viewer.current_idx
-                    self.zoom_viewer.load_existing_photos(PHOTO_DIR)
+                    photos = self.zoom_viewer.photos
+                    if removed and 0 <= old_idx < len(photos) and photos[old_idx] == photo_to_delete:
+                        photos.pop(old_idx)  # The rest of the gallery is unchanged: no rescan
+                    else:
+                        self.zoom_viewer.load_existing_photos(PHOTO_DIR)
                     if self.zoom_viewer.photos:
                         # Show next photo in gallery (or previous if we were at end)
                         new_idx = min(old_idx, len(self.zoom_viewer.photos) - 1)
@@ -2416,23 +3633,20 @@ class PhotoBooth:
 
     def action_view_photos(self):
         """Open gallery to view and print existing photos"""
-        # Get all photos in the photo directory
-        photos = sorted(glob.glob(os.path.join(PHOTO_DIR, "*.jpg")), key=os.path.getmtime, reverse=True)
+        # Set up the zoom viewer with the gallery (use existing or create with correct params)
+        if not self.zoom_viewer:
+            self.zoom_viewer = PhotoZoomViewer(self.canvas, self.ui_photo, self.width, self.height)
+        
+        # One scandir listing (oldest first) serves both the empty check and the gallery
+        self.zoom_viewer.load_existing_photos(PHOTO_DIR)
+        photos = self.zoom_viewer.photos
         if not photos:
             from tkinter import messagebox
             messagebox.showinfo("No Photos", "No photos in gallery yet.\nTap anywhere to take your first photo!")
             return
         
         # Load the most recent photo into viewer
-        self.current_photo_path = photos[0]
-        
-        # Set up the zoom viewer with the gallery (use existing or create with correct params)
-        if not self.zoom_viewer:
-            self.zoom_viewer = PhotoZoomViewer(self.canvas, self.ui_photo, self.width, self.height)
-        
-        # Load gallery and display
-        self.zoom_viewer.load_existing_photos(PHOTO_DIR)
-        self.zoom_viewer.current_idx = 0
+        self.current_photo_path = photos[-1]
         self.zoom_viewer.load_photo(self.current_photo_path)
         
         self.update_ui_state("RESULT")
@@ -2447,9 +3661,8 @@ class PhotoBooth:
         # Check if photo already uploaded (exists in DRIVE_DIR)
         if self.current_photo_path and os.path.exists(self.current_photo_path):
             filename = os.path.basename(self.current_photo_path)
-            dest = os.path.join(DRIVE_DIR, filename)
             
-            if os.path.exists(dest):
+            if filename in self._uploaded_set:
                 # Already uploaded - show message
                 ThemedDialog.show_message(
                     self.root,
@@ -2470,16 +3683,19 @@ class PhotoBooth:
             return
         
         self.btn_save.config(text="☁️ UPLOADING...", state="disabled")
-        threading.Thread(target=self._save_thread, daemon=True).start()
+        # Hand the worker the photo as it is now: the gallery may move on meanwhile
+        threading.Thread(target=self._save_thread, args=(self.current_photo_path,), daemon=True).start()
 
-    def _save_thread(self):
+    def _save_thread(self, photo_path: Optional[str]):
         success = False
         try:
-            if self.current_photo_path and os.path.exists(self.current_photo_path):
-                filename = os.path.basename(self.current_photo_path)
+            # No second exists() here: action_save checked it, and copy2 raises if it's gone
+            if photo_path:
+                filename = os.path.basename(photo_path)
                 dest = os.path.join(DRIVE_DIR, filename)
-                shutil.copy2(self.current_photo_path, dest)
+                fast_copy(photo_path, dest)
                 write_log(f"saved to drive: {dest}")
+                self._uploaded_set.add(filename)
                 success = True
         except Exception as e:
             write_log(f"save error: {e}")
@@ -2517,40 +3733,46 @@ class PhotoBooth:
             return
         
         self.btn_print.config(text="🖨️ PRINTING...", state="disabled")
-        threading.Thread(target=self._print_thread, daemon=True).start()
+        threading.Thread(target=self._print_thread, args=(self.current_photo_path,), daemon=True).start()
 
-    def _print_thread(self):
+    def _print_thread(self, photo_path: Optional[str]):
         global _print_job_counter
         _print_job_counter += 1
         job_number = _print_job_counter
         success = False
         
         try:
-            if self.current_photo_path and os.path.exists(self.current_photo_path):
-                filename = os.path.basename(self.current_photo_path)
-                dest = os.path.join(DRIVE_DIR, filename)
+            # Printing modules are only needed here
+            import win32print
+            import win32ui
+            from PIL import ImageWin
+
+            if photo_path and os.path.exists(photo_path):
                 # Don't copy to drive during print - keeps Upload button state separate
-                # shutil.copy2(self.current_photo_path, dest)
-                # write_log(f"[Print #{job_number}] Saved to drive: {dest}")
                 
                 try:
                     printer_name = win32print.GetDefaultPrinter()
                     write_log(f"[Print #{job_number}] Printer: {printer_name}")
                     
-                    img = Image.open(self.current_photo_path)
+                    img = Image.open(photo_path)
                     img_width, img_height = img.size
                     write_log(f"[Print #{job_number}] Image size: {img_width}x{img_height} pixels")
                     
-                    hdc = win32ui.CreateDC()
-                    hdc.CreatePrinterDC(printer_name)
-                    
-                    # Get printer capabilities
-                    # HORZRES (8) = width in pixels, VERTRES (10) = height in pixels
-                    # LOGPIXELSX (88) = DPI horizontal, LOGPIXELSY (90) = DPI vertical
-                    printable_width = hdc.GetDeviceCaps(8)   # HORZRES
-                    printable_height = hdc.GetDeviceCaps(10)  # VERTRES
-                    printer_dpi_x = hdc.GetDeviceCaps(88)     # LOGPIXELSX
-                    printer_dpi_y = hdc.GetDeviceCaps(90)     # LOGPIXELSY
+                    # Printer capabilities don't change between jobs: read them once per
+                    # printer, from a DC that is released straight away
+                    caps = _PRINTER_CAPS.get(printer_name)
+                    if caps is None:
+                        hdc = win32ui.CreateDC()
+                        hdc.CreatePrinterDC(printer_name)
+                        try:
+                            # HORZRES (8) = width in pixels, VERTRES (10) = height in pixels
+                            # LOGPIXELSX (88) = DPI horizontal, LOGPIXELSY (90) = DPI vertical
+                            caps = _PRINTER_CAPS[printer_name] = (
+                                hdc.GetDeviceCaps(8), hdc.GetDeviceCaps(10),
+                                hdc.GetDeviceCaps(88), hdc.GetDeviceCaps(90))
+                        finally:
+                            hdc.DeleteDC()
+                    printable_width, printable_height, printer_dpi_x, printer_dpi_y = caps
                     
                     write_log(f"[Print #{job_number}] Printable area: {printable_width}x{printable_height} pixels at {printer_dpi_x}x{printer_dpi_y} DPI")
                     
@@ -2591,17 +3813,32 @@ class PhotoBooth:
                     
                     write_log(f"[Print #{job_number}] Output: {dest_width}x{dest_height} at ({x_offset},{y_offset})")
                     
-                    # Start print job
-                    hdc.StartDoc(f"PhotoBooth Print #{job_number}")
-                    hdc.StartPage()
+                    # Resample to the exact output size here (DCT-scaled decode + LANCZOS)
+                    # so GDI blits 1:1 instead of stretching the full-resolution frame
+                    if img.format == "JPEG":
+                        img.draft("RGB", (dest_width, dest_height))
+                    img_print = img.convert("RGB")
+                    if img_print.size != (dest_width, dest_height):
+                        img_print = img_print.resize((dest_width, dest_height), Image.Resampling.LANCZOS)
                     
-                    dib = ImageWin.Dib(img)
+                    dib = ImageWin.Dib(img_print)
                     hdc_rect = (x_offset, y_offset, x_offset + dest_width, y_offset + dest_height)
-                    dib.draw(hdc.GetHandleOutput(), hdc_rect)
+                    img_print.close()
+                    img.close()
                     
-                    hdc.EndPage()
-                    hdc.EndDoc()
-                    hdc.DeleteDC()
+                    # The spooler DC is only held for the job itself, never across the
+                    # decode/resize above, and is released even if the job fails
+                    hdc = win32ui.CreateDC()
+                    hdc.CreatePrinterDC(printer_name)
+                    try:
+                        # Start print job
+                        hdc.StartDoc(f"PhotoBooth Print #{job_number}")
+                        hdc.StartPage()
+                        dib.draw(hdc.GetHandleOutput(), hdc_rect)
+                        hdc.EndPage()
+                        hdc.EndDoc()
+                    finally:
+                        hdc.DeleteDC()
                     
                     write_log(f"[Print #{job_number}] ✓ Print job sent successfully!")
                     success = True
@@ -2629,6 +3866,7 @@ class PhotoBooth:
         if now - self.last_retry_time < 2:
             return
         self.last_retry_time = now
+        _PRINTER_CAPS.clear()  # The default printer may have been changed too
 
         def retry_thread():
             try:
@@ -2643,19 +3881,21 @@ class PhotoBooth:
         if not self.running:
             return
         
+        # Snow is hidden in RESULT: stop ticking altogether, so photo viewing gets the
+        # Tk thread to itself; update_ui_state restarts the loop on the way out
+        if self.snow_paused:
+            self._animate_parked = True
+            return
+        
         # Increment animation frame
         self.animation_frame += 1
         
-        # Pause animations during RESULT mode for better performance
-        if self.mode != "RESULT":
-            # Update snowflakes
-            for flake in self.snowflakes:
-                flake.update()
-            self.canvas.tag_lower("snow")
-            
+        # Update snowflakes
+        self.snowflakes.update_all()
+        
+        if self._decor_animated:
             # Pulsing year color animation (every 15 frames)
             if self.animation_frame % 15 == 0 and hasattr(self, 'ui_year'):
-                import math
                 # Cycle between gold colors
                 colors = [THEME_ACCENT, "#FFA500", "#FF8C00", "#FFB347", THEME_ACCENT_2, THEME_ACCENT]
                 color_idx = (self.animation_frame // 15) % len(colors)
@@ -2663,49 +3903,30 @@ class PhotoBooth:
                     self.canvas.itemconfig(self.ui_year, fill=colors[color_idx])
                 except Exception:
                     pass
-            
-            # Twinkling stars animation (every 3 frames for smooth effect)
-            if self.animation_frame % 3 == 0 and hasattr(self, 'twinkling_stars'):
-                import math
-                for star in self.twinkling_stars:
-                    try:
-                        # Calculate pulsing size
-                        phase = star['phase'] + self.animation_frame * star['speed']
-                        scale = 0.6 + 0.4 * abs(math.sin(phase))
-                        new_size = int(star['base_size'] * scale)
-                        new_size = max(4, min(16, new_size))
-                        
-                        # Update font size for pulsing effect
-                        self.canvas.itemconfig(
-                            star['id'],
-                            font=("Arial", new_size, "bold")
-                        )
-                    except Exception:
-                        pass
-        
+
         self.root.after(ANIMATION_FPS, self.animate)
 
     def _zoom_in(self):
         """Keyboard shortcut: zoom in"""
         if self.zoom_viewer and self.mode == "RESULT":
-            self.zoom_viewer.zoom_level *= 1.2
-            self.zoom_viewer.zoom_level = min(self.zoom_viewer.zoom_level, self.zoom_viewer.max_zoom)
-            self.zoom_viewer._display_current_photo_fast()
+            self.zoom_viewer._set_zoom(self.zoom_viewer.zoom_level * 1.2)
+            self.zoom_viewer._clamp_pan()
+            self.zoom_viewer._schedule_render()
 
     def _zoom_out(self):
         """Keyboard shortcut: zoom out"""
         if self.zoom_viewer and self.mode == "RESULT":
-            self.zoom_viewer.zoom_level *= 0.8
-            self.zoom_viewer.zoom_level = max(self.zoom_viewer.zoom_level, self.zoom_viewer.min_zoom)
-            self.zoom_viewer._display_current_photo_fast()
+            self.zoom_viewer._set_zoom(self.zoom_viewer.zoom_level * 0.8)
+            self.zoom_viewer._clamp_pan()
+            self.zoom_viewer._schedule_render()
 
     def _zoom_reset(self):
         """Keyboard shortcut: reset zoom (press 0)"""
         if self.zoom_viewer and self.mode == "RESULT":
-            self.zoom_viewer.zoom_level = 1.0
+            self.zoom_viewer._set_zoom(1.0)
             self.zoom_viewer.pan_x = 0
             self.zoom_viewer.pan_y = 0
-            self.zoom_viewer._display_current_photo_fast()
+            self.zoom_viewer._schedule_render()
 
     def _prev_photo(self):
         """Keyboard shortcut: previous photo (Left arrow)"""
@@ -2720,6 +3941,8 @@ class PhotoBooth:
     def quit_app(self):
         self.running = False
         self.monitoring_camera = False
+        if self.zoom_viewer:
+            self.zoom_viewer.close()
         self.camera_manager.disconnect()
         self.root.quit()
         self.root.destroy()
@@ -2743,7 +3966,9 @@ def main():
     print("=" * 60)
 
     root = tk.Tk()
-    app = PhotoBooth(root)
+    # Start camera setup now so it overlaps UI construction and the intro screen
+    setup_future = run_in_background(fully_automated_camera_setup)
+    app = PhotoBooth(root, setup_future=setup_future)
     root.mainloop()
 
 